@@ -1,18 +1,15 @@
 """Check what tables exist in the database."""
 
-import asyncio
+from sqlalchemy import inspect
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
+from datafusion.database import engine
+from datafusion.runtime import run
 
 
 async def check_tables():
-    engine = create_async_engine("sqlite+aiosqlite:///datafusion.db")
     async with engine.connect() as conn:
-        result = await conn.execute(
-            text("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-        )
-        tables = [row[0] for row in result]
+        table_names = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+        tables = sorted(table_names)
 
         print("Tables in database:")
         for table in tables:
@@ -36,8 +33,6 @@ async def check_tables():
             status = "✅" if table in tables else "❌"
             print(f"  {status} {table}")
 
-    await engine.dispose()
-
 
 if __name__ == "__main__":
-    asyncio.run(check_tables())
+    run(check_tables())
@@ -1,26 +1,23 @@
 """Direct database creation script - bypasses migrations for testing."""
 
-import asyncio
+# Importing the database registers every model with Base.metadata
+from datafusion.database import Base, engine
+from datafusion.runtime import run
 
-from sqlalchemy.ext.asyncio import create_async_engine
 
-# Import all model modules to register them with Base.metadata
-from datafusion.database import Base
+def _recreate_schema(sync_conn):
+    """Drop all tables, then create them from the models."""
+    Base.metadata.drop_all(sync_conn)
+    Base.metadata.create_all(sync_conn)
 
 
 async def create_database():
     """Create database using SQLAlchemy models directly."""
-    engine = create_async_engine("sqlite+aiosqlite:///datafusion.db", echo=True)
-
     async with engine.begin() as conn:
-        # Drop all tables first
-        await conn.run_sync(Base.metadata.drop_all)
-        # Create all tables
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_recreate_schema)
 
-    await engine.dispose()
     print("\n✅ Database created successfully from models!")
 
 
 if __name__ == "__main__":
-    asyncio.run(create_database())
+    run(create_database())
@@ -0,0 +1,22 @@
+"""Gunicorn configuration for production deployments.
+
+Run with: gunicorn -c gunicorn_conf.py datafusion.main:app
+"""
+
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# Defaults to a single worker: user settings (api/settings.py _settings_store)
+# live in process memory, so with several workers a PUT handled by one is
+# invisible to a GET on another. Raise WEB_CONCURRENCY only once that state
+# moves into the database.
+#
+# Each worker owns its own connection pool, so the database sees up to
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections. Keep that below the
+# server's max_connections (Postgres defaults to 100), e.g. by lowering
+# DB_POOL_SIZE when adding workers.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+keepalive = 5
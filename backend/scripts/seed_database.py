@@ -2,361 +2,371 @@
 
 import argparse
 import asyncio
+import enum
+import logging
 import sys
+from contextlib import asynccontextmanager
+from itertools import islice
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 
+from datafusion.config import settings
 from datafusion.content.system_directives import DIRECTIVES
-from datafusion.database import AsyncSessionLocal, Base, engine
-from datafusion.generators import generate_full_population
+from datafusion.database import AsyncSessionLocal, Base, engine, insert_or_ignore
+from datafusion.generators import iter_population
 from datafusion.generators.messages import MessageGenerator
+from datafusion.generators.rows import DOMAINS, POPULATION_MODELS, population_rows
 from datafusion.generators.scenarios import seed_scenario
 from datafusion.generators.system_seed_data import (
     get_neighborhood_seed_data,
     get_news_channel_seed_data,
 )
-from datafusion.models.finance import (
-    BankAccount,
-    Debt,
-    FinanceRecord,
-    Transaction,
-)
-from datafusion.models.health import (
-    HealthCondition,
-    HealthMedication,
-    HealthRecord,
-    HealthVisit,
-)
-from datafusion.models.judicial import (
-    CivilCase,
-    CriminalRecord,
-    JudicialRecord,
-    TrafficViolation,
-)
+from datafusion.logging_config import queued_console_logging
+from datafusion.models.finance import FinanceRecord, Transaction
+from datafusion.models.health import HealthRecord
+from datafusion.models.judicial import JudicialRecord
 from datafusion.models.location import InferredLocation, LocationRecord
 from datafusion.models.messages import MessageRecord
 from datafusion.models.npc import NPC
-from datafusion.models.social import (
-    PrivateInference,
-    PublicInference,
-    SocialMediaRecord,
-)
+from datafusion.models.social import SocialMediaRecord
 from datafusion.models.system_mode import Directive, Neighborhood, NewsChannel
+from datafusion.runtime import run
 
+log = logging.getLogger(__name__)
 
-async def reset_database():
-    """Drop and recreate all tables."""
-    print("Resetting database...")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
-    print("Database reset complete.")
 
+def _recreate_schema(sync_conn):
+    """Drop and recreate all tables on one synchronous connection."""
+    Base.metadata.drop_all(sync_conn)
+    Base.metadata.create_all(sync_conn)
 
-async def seed_population(count: int, seed: int | None):
-    """Seed random population NPCs."""
-    print(f"Generating {count} NPCs with seed={seed}...")
-    data = generate_full_population(count, seed)
 
-    async with AsyncSessionLocal() as db:
-        npcs_created = 0
-        health_records_created = 0
-        finance_records_created = 0
-        judicial_records_created = 0
-        location_records_created = 0
-        social_media_records_created = 0
-
-        for npc_data in data["npcs"]:
-            npc_id = npc_data.pop("id")
-            health_data = data["health_records"][str(npc_id)]
-            finance_data = data["finance_records"][str(npc_id)]
-            judicial_data = data["judicial_records"][str(npc_id)]
-            location_data = data["location_records"][str(npc_id)]
-            social_data = data["social_media_records"][str(npc_id)]
-
-            # Create NPC
-            npc = NPC(id=npc_id, **npc_data)
-            db.add(npc)
-            await db.flush()
-            npcs_created += 1
-
-            # Create health record
-            health_record = HealthRecord(
-                npc_id=npc.id,
-                insurance_provider=health_data["insurance_provider"],
-                primary_care_physician=health_data["primary_care_physician"],
-            )
-            db.add(health_record)
-            await db.flush()
-            health_records_created += 1
-
-            for condition_data in health_data["conditions"]:
-                condition = HealthCondition(
-                    health_record_id=health_record.id,
-                    **condition_data,
-                )
-                db.add(condition)
-
-            for medication_data in health_data["medications"]:
-                medication = HealthMedication(
-                    health_record_id=health_record.id,
-                    **medication_data,
-                )
-                db.add(medication)
-
-            for visit_data in health_data["visits"]:
-                visit = HealthVisit(
-                    health_record_id=health_record.id,
-                    **visit_data,
-                )
-                db.add(visit)
-
-            # Create finance record
-            finance_record = FinanceRecord(
-                npc_id=npc.id,
-                employment_status=finance_data["employment_status"],
-                employer_name=finance_data["employer_name"],
-                annual_income=finance_data["annual_income"],
-                credit_score=finance_data["credit_score"],
-            )
-            db.add(finance_record)
-            await db.flush()
-            finance_records_created += 1
-
-            for account_data in finance_data["bank_accounts"]:
-                account = BankAccount(
-                    finance_record_id=finance_record.id,
-                    **account_data,
-                )
-                db.add(account)
-
-            for debt_data in finance_data["debts"]:
-                debt = Debt(
-                    finance_record_id=finance_record.id,
-                    **debt_data,
-                )
-                db.add(debt)
+async def reset_database():
+    """Drop and recreate all tables."""
+    log.info("Resetting database...")
+    async with engine.begin() as conn:
+        # One run_sync keeps the whole reset in a single greenlet hop and transaction
+        await conn.run_sync(_recreate_schema)
+    log.info("Database reset complete.")
 
-            for transaction_data in finance_data["transactions"]:
-                transaction = Transaction(
-                    finance_record_id=finance_record.id,
-                    **transaction_data,
-                )
-                db.add(transaction)
-
-            # Create judicial record
-            judicial_record = JudicialRecord(
-                npc_id=npc.id,
-                has_criminal_record=judicial_data["has_criminal_record"],
-                has_civil_cases=judicial_data["has_civil_cases"],
-                has_traffic_violations=judicial_data["has_traffic_violations"],
-            )
-            db.add(judicial_record)
-            await db.flush()
-            judicial_records_created += 1
-
-            for criminal_data in judicial_data["criminal_records"]:
-                criminal_record = CriminalRecord(
-                    judicial_record_id=judicial_record.id,
-                    **criminal_data,
-                )
-                db.add(criminal_record)
 
-            for civil_case_data in judicial_data["civil_cases"]:
-                civil_case = CivilCase(
-                    judicial_record_id=judicial_record.id,
-                    **civil_case_data,
-                )
-                db.add(civil_case)
+# Rows per INSERT statement. SQLite handles large batches well; lower this for
+# databases with tight bind-parameter limits.
+BATCH_SIZE = 1000
 
-            for violation_data in judicial_data["traffic_violations"]:
-                violation = TrafficViolation(
-                    judicial_record_id=judicial_record.id,
-                    **violation_data,
-                )
-                db.add(violation)
 
-            # Create location record
-            location_record = LocationRecord(
-                npc_id=npc.id,
-                tracking_enabled=location_data["tracking_enabled"],
-                data_retention_days=location_data["data_retention_days"],
-            )
-            db.add(location_record)
-            await db.flush()
-            location_records_created += 1
-
-            for location_inference_data in location_data["inferred_locations"]:
-                location_inference = InferredLocation(
-                    location_record_id=location_record.id,
-                    **location_inference_data,
-                )
-                db.add(location_inference)
-
-            # Create social media record
-            social_record = SocialMediaRecord(
-                npc_id=npc.id,
-                has_public_profile=social_data["has_public_profile"],
-                primary_platform=social_data["primary_platform"],
-                account_created_date=social_data["account_created_date"],
-                follower_count=social_data["follower_count"],
-                post_frequency=social_data["post_frequency"],
-                uses_end_to_end_encryption=social_data["uses_end_to_end_encryption"],
-                encryption_explanation=social_data["encryption_explanation"],
-            )
-            db.add(social_record)
-            await db.flush()
-            social_media_records_created += 1
-
-            for public_inference_data in social_data["public_inferences"]:
-                public_inference = PublicInference(
-                    social_media_record_id=social_record.id,
-                    **public_inference_data,
-                )
-                db.add(public_inference)
+# Core INSERT statements are built once and reused for every batch, so each
+# flush hits SQLAlchemy's compiled-statement cache without re-constructing them.
+# They target the tables rather than the mapped classes and run on a Core
+# connection, which skips the ORM bulk-insert layer's per-row work; the row
+# dicts are already keyed by column name.
+POPULATION_INSERTS = {model: insert(model.__table__) for model in POPULATION_MODELS}
 
-            for private_inference_data in social_data["private_inferences"]:
-                private_inference = PrivateInference(
-                    social_media_record_id=social_record.id,
-                    **private_inference_data,
-                )
-                db.add(private_inference)
 
-        await db.commit()
+async def flush_batch(connection, model, rows: list[dict], batch_size: int = BATCH_SIZE) -> int:
+    """Insert buffered rows for a model, then clear the buffer.
 
-        print(
-            f"Created {npcs_created} NPCs, "
-            f"{health_records_created} health records, "
-            f"{finance_records_created} finance records, "
-            f"{judicial_records_created} judicial records, "
-            f"{location_records_created} location records, "
-            f"{social_media_records_created} social media records."
+    SQLAlchemy's insertmanyvalues mode splits the rows into multi-row INSERT
+    pages of batch_size, so the driver never receives one oversized statement.
+    """
+    flushed = len(rows)
+    if rows:
+        await connection.execute(
+            POPULATION_INSERTS[model],
+            rows,
+            execution_options={"insertmanyvalues_page_size": batch_size},
+        )
+    rows.clear()
+    return flushed
+
+
+def _copy_columns(table, rows: list[dict]) -> list:
+    """Columns to COPY: everything the rows set, plus columns with client-side defaults.
+
+    Columns left out (timestamps) fall back to their server defaults.
+    """
+    keys = set().union(*rows)
+    return [column for column in table.columns if column.key in keys or column.default is not None]
+
+
+def _copy_value(column, row: dict):
+    """Resolve a row value the way the ORM would before sending it to the driver."""
+    if column.key in row:
+        value = row[column.key]
+    elif column.default is None:
+        return None
+    elif column.default.is_callable:
+        value = column.default.arg(None)
+    else:
+        value = column.default.arg
+    # SQLAlchemy Enum columns store the member name
+    if isinstance(value, enum.Enum):
+        return value.name
+    return value
+
+
+async def copy_batch(connection, model, rows: list[dict], batch_size: int = BATCH_SIZE) -> int:
+    """Load buffered rows with PostgreSQL COPY via asyncpg, then clear the buffer."""
+    flushed = len(rows)
+    if not rows:
+        return 0
+    table = model.__table__
+    columns = _copy_columns(table, rows)
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name,
+        records=[tuple(_copy_value(column, row) for column in columns) for row in rows],
+        columns=[column.name for column in columns],
+    )
+    rows.clear()
+    return flushed
+
+
+# Highest-cardinality child tables, which can skip statement compilation
+RAW_INSERT_MODELS = (Transaction, InferredLocation)
+# Rows per raw INSERT, keeping rows * columns under SQLite's 32766 bind-parameter limit
+RAW_INSERT_CHUNK = 500
+
+
+async def raw_insert_batch(
+    connection, model, rows: list[dict], batch_size: int = BATCH_SIZE
+) -> int:
+    """Insert buffered rows as hand-built multi-row INSERTs, then clear the buffer.
+
+    Only RAW_INSERT_MODELS on SQLite take this path; every other table falls
+    back to flush_batch. Values still go through each column's bind processor,
+    so they are stored exactly as SQLAlchemy would store them.
+    """
+    if model not in RAW_INSERT_MODELS or connection.dialect.name != "sqlite":
+        return await flush_batch(connection, model, rows, batch_size)
+    flushed = len(rows)
+    if not rows:
+        return 0
+    dialect = connection.dialect
+    table = model.__table__
+    columns = _copy_columns(table, rows)
+    processors = [column.type.dialect_impl(dialect).bind_processor(dialect) for column in columns]
+    quote = dialect.identifier_preparer.quote
+    head = (
+        f"INSERT INTO {quote(table.name)} "
+        f"({', '.join(quote(column.name) for column in columns)}) VALUES "
+    )
+    placeholders = f"({', '.join('?' * len(columns))})"
+    for start in range(0, flushed, RAW_INSERT_CHUNK):
+        chunk = rows[start : start + RAW_INSERT_CHUNK]
+        params = []
+        for row in chunk:
+            for column, process in zip(columns, processors, strict=True):
+                value = _copy_value(column, row)
+                params.append(process(value) if process else value)
+        await connection.exec_driver_sql(
+            head + ", ".join([placeholders] * len(chunk)), tuple(params)
         )
+    rows.clear()
+    return flushed
+
+
+# Per-dialect statements that turn off commit durability for the seeding
+# connection, and the ones that restore it (matching datafusion.database)
+DURABILITY_TOGGLES = {
+    "sqlite": ("PRAGMA synchronous = OFF", "PRAGMA synchronous = NORMAL"),
+    "postgresql": ("SET synchronous_commit = OFF", "RESET synchronous_commit"),
+}
+
+
+@asynccontextmanager
+async def _relaxed_durability(conn):
+    """Skip fsync on this connection until the block exits.
+
+    The setting is connection-scoped, so it is restored before the connection
+    goes back to the pool.
+    """
+    toggles = DURABILITY_TOGGLES.get(conn.dialect.name)
+    if toggles is None:
+        yield
+        return
+    relax, restore = toggles
+    await conn.exec_driver_sql(relax)
+    await conn.commit()
+    try:
+        yield
+    finally:
+        await conn.exec_driver_sql(restore)
+        await conn.commit()
+
+
+async def seed_population(
+    count: int,
+    seed: int | None,
+    batch_size: int = BATCH_SIZE,
+    domains: tuple[str, ...] = DOMAINS,
+    raw_sql: bool = False,
+):
+    """Seed random population NPCs with records for the given domains.
+
+    With raw_sql, the biggest child tables are inserted with hand-built SQL on
+    SQLite (see raw_insert_batch) so it can be benchmarked against Core inserts.
+    """
+    unknown = set(domains) - set(DOMAINS)
+    if unknown:
+        raise ValueError(f"Unknown population domains: {', '.join(sorted(unknown))}")
+
+    log.info("Generating %d NPCs with seed=%s...", count, seed)
+
+    created: dict[type, int] = dict.fromkeys(POPULATION_MODELS, 0)
+
+    # One transaction for the whole phase: a single COMMIT at the end, with
+    # fsync relaxed since a crashed seed is simply rerun with --reset
+    async with engine.connect() as conn, _relaxed_durability(conn), conn.begin():
+        # COPY is far cheaper than batched INSERTs on PostgreSQL
+        if conn.dialect.name == "postgresql":
+            flush = copy_batch
+        elif raw_sql:
+            flush = raw_insert_batch
+        else:
+            flush = flush_batch
+
+        # The generators assign record ids client-side, so each chunk arrives
+        # as ready-to-insert rows per table, already joined to their parents.
+        bundles = iter_population(count, seed)
+        while chunk := list(islice(bundles, batch_size)):
+            # Tables come back in foreign-key order, so parents land first
+            for model, rows in population_rows(chunk, domains).items():
+                created[model] += await flush(conn, model, rows, batch_size)
+            log.info("  %d/%d NPCs inserted...", created[NPC], count)
+
+    log.info(
+        "Created %d NPCs, %d health records, %d finance records, %d judicial records, "
+        "%d location records, %d social media records.",
+        created[NPC],
+        created[HealthRecord],
+        created[FinanceRecord],
+        created[JudicialRecord],
+        created[LocationRecord],
+        created[SocialMediaRecord],
+    )
 
 
 async def seed_scenario_npcs(scenario: str):
     """Seed scenario-specific NPCs."""
-    print(f"Seeding scenario: {scenario}...")
+    log.info("Seeding scenario: %s...", scenario)
     async with AsyncSessionLocal() as db:
         result = await seed_scenario(db, scenario)
         if result["npcs_created"] == 0:
-            print(f"Scenario '{scenario}' NPCs already exist, skipping.")
+            log.info("Scenario '%s' NPCs already exist, skipping.", scenario)
         else:
-            print(
-                f"Created {result['npcs_created']} scenario NPCs "
-                f"and {result['health_records_created']} health records."
+            log.info(
+                "Created %d scenario NPCs and %d health records.",
+                result["npcs_created"],
+                result["health_records_created"],
             )
 
 
-async def get_stats():
-    """Get database statistics."""
-    async with AsyncSessionLocal() as db:
-        npc_count = await db.execute(select(NPC))
-        npcs = len(npc_count.scalars().all())
-
-        health_count = await db.execute(select(HealthRecord))
-        health_records = len(health_count.scalars().all())
-
-        finance_count = await db.execute(select(FinanceRecord))
-        finance_records = len(finance_count.scalars().all())
-
-        judicial_count = await db.execute(select(JudicialRecord))
-        judicial_records = len(judicial_count.scalars().all())
+# Tables reported in the post-seed summary
+STATS_MODELS = (
+    NPC,
+    HealthRecord,
+    FinanceRecord,
+    JudicialRecord,
+    LocationRecord,
+    SocialMediaRecord,
+)
 
-        location_count = await db.execute(select(LocationRecord))
-        location_records = len(location_count.scalars().all())
+# All counts come back as one row from a single round trip
+STATS_QUERY = select(
+    *(select(func.count()).select_from(model).scalar_subquery() for model in STATS_MODELS)
+)
 
-        social_count = await db.execute(select(SocialMediaRecord))
-        social_media_records = len(social_count.scalars().all())
 
-        return (
-            npcs,
-            health_records,
-            finance_records,
-            judicial_records,
-            location_records,
-            social_media_records,
-        )
+async def get_stats():
+    """Get database statistics."""
+    async with AsyncSessionLocal() as db:
+        return tuple((await db.execute(STATS_QUERY)).one())
 
 
 async def seed_directives():
     """Seed directives for System Mode."""
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(select(Directive).limit(1))
-        if result.scalar_one_or_none():
-            print("Directives already exist, skipping.")
-            return
-
-        print(f"Seeding {len(DIRECTIVES)} directives...")
-        for directive_data in DIRECTIVES:
-            directive = Directive(**directive_data)
-            db.add(directive)
-        await db.commit()
-        print(f"Created {len(DIRECTIVES)} directives.")
+    async with AsyncSessionLocal() as db, db.begin():
+        # Existing directives (by directive_key) are skipped by the database
+        stmt = insert_or_ignore(Directive, db.bind.dialect.name).values(list(DIRECTIVES))
+        result = await db.execute(stmt)
+    if result.rowcount:
+        log.info("Created %d directives.", result.rowcount)
+    else:
+        log.info("Directives already exist, skipping.")
 
 
 async def seed_neighborhoods():
     """Seed neighborhoods for System Mode."""
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(select(Neighborhood).limit(1))
-        if result.scalar_one_or_none():
-            print("Neighborhoods already exist, skipping.")
-            return
-
-        neighborhood_data = get_neighborhood_seed_data()
-        print(f"Seeding {len(neighborhood_data)} neighborhoods...")
-        for n_data in neighborhood_data:
-            neighborhood = Neighborhood(**n_data)
-            db.add(neighborhood)
-        await db.commit()
-        print(f"Created {len(neighborhood_data)} neighborhoods.")
+    async with AsyncSessionLocal() as db, db.begin():
+        # Existing neighborhoods (by name) are skipped by the database
+        stmt = insert_or_ignore(Neighborhood, db.bind.dialect.name).values(
+            get_neighborhood_seed_data()
+        )
+        result = await db.execute(stmt)
+    if result.rowcount:
+        log.info("Created %d neighborhoods.", result.rowcount)
+    else:
+        log.info("Neighborhoods already exist, skipping.")
 
 
 async def seed_news_channels():
     """Seed news channels for System Mode."""
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(select(NewsChannel).limit(1))
-        if result.scalar_one_or_none():
-            print("News channels already exist, skipping.")
+    async with AsyncSessionLocal() as db, db.begin():
+        # news_channels has no natural key to conflict on, so probe for rows instead
+        if (await db.execute(select(NewsChannel.id).limit(1))).first():
+            log.info("News channels already exist, skipping.")
             return
-
         channel_data = get_news_channel_seed_data()
-        print(f"Seeding {len(channel_data)} news channels...")
-        for c_data in channel_data:
-            channel = NewsChannel(**c_data)
-            db.add(channel)
-        await db.commit()
-        print(f"Created {len(channel_data)} news channels.")
+        await db.execute(insert(NewsChannel), channel_data)
+    log.info("Created %d news channels.", len(channel_data))
+
+
+# Message histories generated at once, each in its own session. Capped so the
+# NPC id stream plus every generator fit in the connection pool without overflow.
+MESSAGE_CONCURRENCY = max(1, min(8, settings.db_pool_size - 1))
+
 
+async def _seed_npc_messages(npc_id, seed: int, semaphore: asyncio.Semaphore) -> bool:
+    """Generate and commit one NPC's message history in a dedicated session."""
+    async with semaphore:
+        try:
+            async with AsyncSessionLocal() as db, db.begin():
+                await MessageGenerator(db).generate_message_history(npc_id, seed=seed)
+        except Exception:
+            log.exception("Error generating messages for %s", npc_id)
+            return False
+    return True
 
-async def seed_messages():
+
+async def seed_messages(batch_size: int = BATCH_SIZE, concurrency: int = MESSAGE_CONCURRENCY):
     """Generate message records for existing NPCs."""
     async with AsyncSessionLocal() as db:
         # Check if messages already exist
-        result = await db.execute(select(MessageRecord).limit(1))
-        if result.scalar_one_or_none():
-            print("Message records already exist, skipping.")
-            return
-
-        # Get all NPCs
-        npcs_result = await db.execute(select(NPC))
-        npcs = npcs_result.scalars().all()
-
-        if not npcs:
-            print("No NPCs found, skipping message generation.")
+        if await db.scalar(select(select(MessageRecord.id).exists())):
+            log.info("Message records already exist, skipping.")
             return
 
-        print(f"Generating messages for {len(npcs)} NPCs...")
-        generator = MessageGenerator(db)
-
-        for i, npc in enumerate(npcs):
-            try:
-                await generator.generate_message_history(npc.id, seed=42 + i)
-            except Exception as e:
-                print(f"Error generating messages for {npc.id}: {e}")
+        # Stream NPC ids so memory stays bounded by batch_size
+        semaphore = asyncio.Semaphore(concurrency)
+        generated = 0
+        total = 0
+        # yield_per sizes the cursor buffer; partitions() then yields chunks of that size
+        npc_ids = await db.stream_scalars(select(NPC.id).execution_options(yield_per=batch_size))
+        async for chunk in npc_ids.partitions():
+            results = await asyncio.gather(
+                *(
+                    _seed_npc_messages(npc_id, 42 + total + i, semaphore)
+                    for i, npc_id in enumerate(chunk)
+                )
+            )
+            total += len(chunk)
+            generated += sum(results)
 
-        await db.commit()
-        print(f"Generated message histories for {len(npcs)} NPCs.")
+    if not total:
+        log.info("No NPCs found, skipping message generation.")
+        return
+    log.info("Generated message histories for %d of %d NPCs.", generated, total)
 
 
 async def main():
@@ -383,6 +393,24 @@ async def main():
         action="store_true",
         help="Drop and recreate all tables before seeding",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Rows per bulk INSERT statement (default: {BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--domains",
+        nargs="+",
+        choices=DOMAINS,
+        default=DOMAINS,
+        help="Population domains to seed records for (default: all)",
+    )
+    parser.add_argument(
+        "--raw-sql",
+        action="store_true",
+        help="Insert the largest population tables with raw SQL (SQLite only)",
+    )
 
     args = parser.parse_args()
 
@@ -390,21 +418,26 @@ async def main():
         if args.reset:
             await reset_database()
 
-        # Always seed directives, neighborhoods, news channels for System Mode FIRST
-        print("Seeding directives...")
-        await seed_directives()
-        print("Seeding neighborhoods...")
-        await seed_neighborhoods()
-        print("Seeding news channels...")
-        await seed_news_channels()
+        # Always seed directives, neighborhoods, news channels for System Mode FIRST,
+        # together with the scenario NPCs. None of them depend on each other or on
+        # the random population, and each uses its own short transaction.
+        log.info("Seeding directives, neighborhoods and news channels...")
+        phases = [seed_directives(), seed_neighborhoods(), seed_news_channels()]
+        if args.scenario:
+            phases.append(seed_scenario_npcs(args.scenario))
+        await asyncio.gather(*phases)
 
+        # The population runs alone: its long write transaction would hold
+        # SQLite's single writer lock against any phase overlapping it.
         if args.population > 0:
-            print(f"Seeding {args.population} NPCs...")
-            await seed_population(args.population, args.seed)
-
-        if args.scenario:
-            print(f"Seeding scenario: {args.scenario}")
-            await seed_scenario_npcs(args.scenario)
+            log.info("Seeding %d NPCs...", args.population)
+            await seed_population(
+                args.population,
+                args.seed,
+                args.batch_size,
+                tuple(args.domains),
+                raw_sql=args.raw_sql,
+            )
 
         # Skip message generation for now - it's very slow
         # await seed_messages()
@@ -417,13 +450,15 @@ async def main():
             location_records,
             social_media_records,
         ) = await get_stats()
-        print(
-            f"\nDatabase summary: {npcs} NPCs, "
-            f"{health_records} health records, "
-            f"{finance_records} finance records, "
-            f"{judicial_records} judicial records, "
-            f"{location_records} location records, "
-            f"{social_media_records} social media records"
+        log.info(
+            "\nDatabase summary: %d NPCs, %d health records, %d finance records, "
+            "%d judicial records, %d location records, %d social media records",
+            npcs,
+            health_records,
+            finance_records,
+            judicial_records,
+            location_records,
+            social_media_records,
         )
 
     except Exception as e:
@@ -432,4 +467,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with queued_console_logging(log):
+        run(main())
@@ -1,13 +1,12 @@
 """Seed directives for System Mode."""
 
-import asyncio
-
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from datafusion.database import AsyncSessionLocal, Base, engine
 from datafusion.models.system_mode import Directive
+from datafusion.runtime import run
 
-DIRECTIVES = [
+DIRECTIVES = (
     {
         "directive_key": "week1_clean_streets",
         "week_number": 1,
@@ -114,7 +113,7 @@ DIRECTIVES = [
         "content_rating": "intense",
         "unlock_condition": {"type": "week_complete", "week": 5},
     },
-]
+)
 
 
 async def seed_directives():
@@ -123,22 +122,17 @@ async def seed_directives():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async with AsyncSessionLocal() as db:
+    async with AsyncSessionLocal() as db, db.begin():
         # Check if directives already exist
-        result = await db.execute(select(Directive).limit(1))
-        existing = result.scalar_one_or_none()
-
-        if existing:
+        if await db.scalar(select(select(Directive.id).exists())):
             print("Directives already exist. Skipping seed.")
             return
 
         print(f"Seeding {len(DIRECTIVES)} directives...")
 
-        for directive_data in DIRECTIVES:
-            directive = Directive(**directive_data)
-            db.add(directive)
+        # One executemany; the JSON columns serialize the dict/list values
+        await db.execute(insert(Directive), list(DIRECTIVES))
 
-        await db.commit()
         print(f"Successfully seeded {len(DIRECTIVES)} directives.")
 
 
@@ -148,4 +142,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,34 +1,31 @@
 """Seed neighborhoods and news channels into the database."""
 
-import asyncio
+from sqlalchemy import select
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-
-from datafusion.database import Base
+from datafusion.database import AsyncSessionLocal, Base, engine
 from datafusion.generators.system_seed_data import (
     get_neighborhood_seed_data,
     get_news_channel_seed_data,
 )
 from datafusion.models.system_mode import Neighborhood, NewsChannel
+from datafusion.runtime import run
 
 
 async def seed_system_data():
     """Seed neighborhoods and news channels."""
-    engine = create_async_engine("sqlite+aiosqlite:///datafusion.db")
-
     # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with async_session() as session:
-        # Check if data already exists
-        from sqlalchemy import select
+    # Both tables are seeded in one transaction with a single COMMIT
+    async with AsyncSessionLocal() as session, session.begin():
+        # Probe both tables for existing data in one round trip
+        probe = await session.execute(
+            select(select(Neighborhood.id).exists(), select(NewsChannel.id).exists())
+        )
+        has_neighborhoods, has_channels = probe.one()
 
-        existing_neighborhoods = await session.execute(select(Neighborhood))
-        if existing_neighborhoods.scalars().first():
+        if has_neighborhoods:
             print("❌ Neighborhoods already exist, skipping...")
         else:
             # Seed neighborhoods
@@ -36,11 +33,9 @@ async def seed_system_data():
             for n_data in neighborhood_data:
                 neighborhood = Neighborhood(**n_data)
                 session.add(neighborhood)
-            await session.commit()
             print(f"✅ Seeded {len(neighborhood_data)} neighborhoods")
 
-        existing_channels = await session.execute(select(NewsChannel))
-        if existing_channels.scalars().first():
+        if has_channels:
             print("❌ News channels already exist, skipping...")
         else:
             # Seed news channels
@@ -48,12 +43,10 @@ async def seed_system_data():
             for c_data in channel_data:
                 channel = NewsChannel(**c_data)
                 session.add(channel)
-            await session.commit()
             print(f"✅ Seeded {len(channel_data)} news channels")
 
-    await engine.dispose()
     print("\n✅ System seed data complete!")
 
 
 if __name__ == "__main__":
-    asyncio.run(seed_system_data())
+    run(seed_system_data())
@@ -2,14 +2,17 @@
 
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import delete, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import delete, exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
+from datafusion.api.responses import ORJSONResponse, etag_matches, make_etag, not_modified
+from datafusion.config import settings
 from datafusion.database import get_db
-from datafusion.models.abuse import AbuseExecution, AbuseRole
+from datafusion.models.abuse import AbuseAction, AbuseExecution, AbuseRole
 from datafusion.models.consequence import TimeSkip
-from datafusion.models.inference import ContentRating
+from datafusion.models.inference import CONTENT_RATING_ORDER, ContentRating
 from datafusion.schemas.abuse import (
     AbuseActionRead,
     AbuseExecuteRequest,
@@ -19,35 +22,81 @@ from datafusion.schemas.abuse import (
 )
 from datafusion.services.abuse_simulator import AbuseSimulator
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Rows fetched per batch when streaming a session history; related actions
+# and targets are selectin-loaded once per batch
+HISTORY_YIELD_PER = 200
+
+# Roles can change in the database at any time, so clients must revalidate
+ROLES_CACHE_CONTROL = "no-cache"
+
+
+async def _abuse_roles_etag(db: AsyncSession, max_content_rating: ContentRating | None) -> str:
+    """
+    ETag for the role listing, from a watermark of the role and action tables.
+
+    Row counts catch deletes and inserts, and the latest updated_at catches
+    edits, without loading any rows.
+    """
+    watermark = await db.execute(
+        select(
+            func.count(AbuseRole.id),
+            func.max(AbuseRole.updated_at),
+            select(func.count(AbuseAction.id)).scalar_subquery(),
+            select(func.max(AbuseAction.updated_at)).scalar_subquery(),
+        )
+    )
+    rating = max_content_rating.value if max_content_rating else None
+    return make_etag(repr((rating, *watermark.one())).encode())
 
 
 @router.get("/roles", response_model=list[AbuseRoleRead])
 async def list_abuse_roles(
+    request: Request,
     max_content_rating: ContentRating | None = Query(default=None),
     db: AsyncSession = Depends(get_db),
-) -> list[AbuseRoleRead]:
+) -> Response:
     """
     List all available abuse roles.
 
     Args:
+        request: Incoming request, checked for a matching If-None-Match
         max_content_rating: Optional filter to exclude roles with actions above this rating
         db: Database session
 
     Returns:
-        List of available roles
+        List of available roles, or an empty 304 if the client's copy is current
     """
-    query = select(AbuseRole)
+    etag = await _abuse_roles_etag(db, max_content_rating)
+    if etag_matches(request, etag):
+        return not_modified(etag, ROLES_CACHE_CONTROL)
+
+    # Only role columns are returned, so skip the actions (and their executions)
+    # the model would otherwise selectin-load, and fail loudly if anything needs them
+    query = select(AbuseRole).options(raiseload("*"))
+    if max_content_rating is not None:
+        # Let the database drop roles with any action rated above the limit
+        max_level = CONTENT_RATING_ORDER[max_content_rating]
+        allowed = [
+            rating.value for rating, level in CONTENT_RATING_ORDER.items() if level <= max_level
+        ]
+        query = query.where(
+            ~exists().where(
+                AbuseAction.role_id == AbuseRole.id,
+                AbuseAction.content_rating.not_in(allowed),
+            )
+        )
     result = await db.execute(query)
-    roles = list(result.scalars().all())
-
-    # Convert to schemas
-    role_schemas = [AbuseRoleRead.model_validate(role) for role in roles]
 
-    # TODO: If max_content_rating provided, filter roles by their actions' ratings
-    # This would require checking if role has any actions <= max_content_rating
+    # Convert to schemas, serialized once here rather than re-validated on the way out
+    role_schemas = [
+        AbuseRoleRead.model_validate(role).model_dump(mode="json") for role in result.scalars()
+    ]
 
-    return role_schemas
+    return ORJSONResponse(
+        role_schemas, headers={"ETag": etag, "Cache-Control": ROLES_CACHE_CONTROL}
+    )
 
 
 @router.get("/roles/{role_key}/actions", response_model=list[AbuseActionRead])
@@ -152,58 +201,70 @@ async def get_execution_consequences(
 @router.get("/session/{session_id}/history", response_model=list[AbuseExecuteResponse])
 async def get_session_history(
     session_id: UUID,
+    limit: int | None = Query(
+        default=None,
+        ge=settings.min_page_size,
+        le=settings.max_page_size,
+    ),
+    offset: int = Query(default=0, ge=0),
     db: AsyncSession = Depends(get_db),
-) -> list[AbuseExecuteResponse]:
+) -> ORJSONResponse:
     """
     Get history of all executions in a session.
 
     Args:
         session_id: The session identifier
+        limit: Optional page size; the whole history is returned when omitted
+        offset: Number of executions to skip
         db: Database session
 
     Returns:
-        List of all executions in this session (chronological order)
+        Executions in this session (chronological order)
     """
-    # Query all executions for this session
+    # Query all executions for this session, with their actions and targets
+    # loaded in one batched query each rather than two queries per execution.
+    # Any other relationship access raises instead of issuing a hidden query.
     query = (
         select(AbuseExecution)
         .where(AbuseExecution.session_id == session_id)
-        .order_by(AbuseExecution.executed_at)
+        .options(
+            selectinload(AbuseExecution.action).raiseload("*"),
+            selectinload(AbuseExecution.target_npc).raiseload("*"),
+            raiseload("*"),
+        )
+        # id breaks ties so pages never overlap
+        .order_by(AbuseExecution.executed_at, AbuseExecution.id)
+        .offset(offset)
+        .execution_options(yield_per=HISTORY_YIELD_PER)
     )
-    result = await db.execute(query)
-    executions = list(result.scalars().all())
+    if limit is not None:
+        query = query.limit(limit)
+    # Rows arrive in yield_per batches, so ORM objects are only held one batch at
+    # a time; the converted history itself is collected and serialized in one piece
+    result = await db.stream(query)
 
     # Convert to response format
     # Note: This is simplified - in a real implementation, we'd reconstruct
     # the full AbuseExecuteResponse for each execution
     responses = []
-    for execution in executions:
-        # Fetch related data
-        from datafusion.models.abuse import AbuseAction
-        from datafusion.models.npc import NPC
-
-        action_query = select(AbuseAction).where(AbuseAction.id == execution.action_id)
-        action_result = await db.execute(action_query)
-        action = action_result.scalar_one()
-
-        npc_query = select(NPC).where(NPC.id == execution.target_npc_id)
-        npc_result = await db.execute(npc_query)
-        npc = npc_result.scalar_one()
+    async for execution in result.scalars():
+        action = execution.action
+        npc = execution.target_npc
 
         # Build response
         response = AbuseExecuteResponse(
             execution_id=execution.id,
             action_name=action.name,
-            target_name=f"{npc.first_name} {npc.last_name}",
-            immediate_result=f"Executed {action.name} on {npc.first_name} {npc.last_name}",
+            target_name=npc.full_name,
+            immediate_result=f"Executed {action.name} on {npc.full_name}",
             data_revealed=None,  # Historical data not stored
             was_detected=execution.was_detected,
             detection_message=execution.detection_method,
             warning=None,
         )
-        responses.append(response)
+        responses.append(response.model_dump(mode="json"))
 
-    return responses
+    return ORJSONResponse(responses)
 
 
 @router.post("/session/{session_id}/reset", status_code=204)
@@ -221,7 +282,12 @@ async def reset_session(
     Returns:
         No content (204 status)
     """
-    # Delete all executions for this session
-    delete_query = delete(AbuseExecution).where(AbuseExecution.session_id == session_id)
+    # Delete all executions for this session. Nothing in this request has
+    # loaded them, so skip matching the deleted rows against the identity map.
+    delete_query = (
+        delete(AbuseExecution)
+        .where(AbuseExecution.session_id == session_id)
+        .execution_options(synchronize_session=False)
+    )
     await db.execute(delete_query)
     await db.commit()
@@ -1,15 +1,17 @@
 """Inference API endpoints for analyzing NPC data across domains."""
 
 import json
-from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
+from datafusion.api.responses import ORJSONResponse, etag_matches, make_etag, not_modified
 from datafusion.database import get_db
-from datafusion.models.inference import ContentRating
+from datafusion.models.inference import CONTENT_RATING_ORDER, ContentRating
 from datafusion.models.npc import NPC
 from datafusion.schemas.domains import DomainType
 from datafusion.schemas.errors import ErrorResponse
@@ -23,41 +25,104 @@ from datafusion.schemas.inference import (
 from datafusion.services.advanced_inference_engine import AdvancedInferenceEngine
 from datafusion.services.inference_rules import INFERENCE_RULES
 
-router = APIRouter(prefix="/inferences", tags=["inferences"])
+router = APIRouter(prefix="/inferences", tags=["inferences"], default_response_class=ORJSONResponse)
+
+
+def _serialize_inference_rules() -> bytes:
+    """Serialize the config rules in InferenceRuleRead shape."""
+    rules_read = []
+    for rule in INFERENCE_RULES:
+        domain_values = [d.value for d in rule["required_domains"]]
+        rules_read.append(
+            {
+                "id": "00000000-0000-0000-0000-000000000000",  # Placeholder for config rules
+                "rule_key": rule["rule_key"],
+                "name": rule["name"],
+                "description": f"Analyzes {', '.join(domain_values)} domain data",
+                # Stored as a JSON string, like database-backed rules
+                "required_domains": json.dumps(domain_values),
+                "scariness_level": rule["scariness_level"],
+                "content_rating": ContentRating(rule["content_rating"]).value,
+                "is_active": True,
+                "created_at": "2026-01-06T00:00:00",  # Placeholder
+                "updated_at": "2026-01-06T00:00:00",  # Placeholder
+            }
+        )
+    return orjson.dumps(rules_read)
+
+
+# The rules are static config, so the response body is built once at import
+INFERENCE_RULES_JSON = _serialize_inference_rules()
+INFERENCE_RULES_ETAG = make_etag(INFERENCE_RULES_JSON)
+# Rules only change on deploy, so clients may reuse them for an hour
+INFERENCE_RULES_CACHE_CONTROL = "public, max-age=3600"
+
+
+def _index_rules_by_domain() -> dict[DomainType, list[tuple[str, frozenset[DomainType]]]]:
+    """Map each domain to the (rule_key, required domains) of rules that need it."""
+    rules_by_domain: dict[DomainType, list[tuple[str, frozenset[DomainType]]]] = {}
+    for rule in INFERENCE_RULES:
+        required = frozenset(rule["required_domains"])
+        for domain in required:
+            rules_by_domain.setdefault(domain, []).append((rule["rule_key"], required))
+    return rules_by_domain
+
+
+RULES_BY_DOMAIN = _index_rules_by_domain()
+
+# Engine results carry enum values as strings; these map them back without
+# going through the Enum constructor for every item
+DOMAINS_BY_VALUE = {domain.value: domain for domain in DomainType}
+CONTENT_RATINGS_BY_VALUE = {rating.value: rating for rating in ContentRating}
 
 
 @router.get(
     "/rules",
     response_model=list[InferenceRuleRead],
 )
-async def list_inference_rules() -> list[InferenceRuleRead]:
+async def list_inference_rules(request: Request) -> Response:
     """
     List all available inference rules.
 
     Useful for documentation and showing players what rules exist.
-    Loaded from inference_rules.py config file.
+    Loaded from inference_rules.py config file. Clients that send back the
+    ETag get an empty 304 instead of the body.
     """
-    # Convert config rules to InferenceRuleRead format
-    rules_read = []
-    for rule in INFERENCE_RULES:
-        # Convert DomainType enums to JSON string
-        required_domains_json = json.dumps([d.value for d in rule["required_domains"]])
-
-        rule_read = InferenceRuleRead(
-            id=UUID("00000000-0000-0000-0000-000000000000"),  # Placeholder for config-based rules
-            rule_key=rule["rule_key"],
-            name=rule["name"],
-            description=f"Analyzes {', '.join(d.value for d in rule['required_domains'])} domain data",
-            required_domains=required_domains_json,
-            scariness_level=rule["scariness_level"],
-            content_rating=rule["content_rating"],
-            is_active=True,
-            created_at=datetime(2026, 1, 6, 0, 0, 0),  # Placeholder
-            updated_at=datetime(2026, 1, 6, 0, 0, 0),  # Placeholder
-        )
-        rules_read.append(rule_read)
+    if etag_matches(request, INFERENCE_RULES_ETAG):
+        return not_modified(INFERENCE_RULES_ETAG, INFERENCE_RULES_CACHE_CONTROL)
+    return Response(
+        content=INFERENCE_RULES_JSON,
+        media_type="application/json",
+        headers={"ETag": INFERENCE_RULES_ETAG, "Cache-Control": INFERENCE_RULES_CACHE_CONTROL},
+    )
+
+
+def _inference_from_engine(inf_dict: dict) -> InferenceResult:
+    """
+    Wrap an inference engine result dict in an InferenceResult.
 
-    return rules_read
+    The engine renders its dicts from the static rule config, so they are
+    trusted: model_construct skips validation, and only the enum fields are
+    converted back from their string values.
+    """
+    return InferenceResult.model_construct(
+        rule_key=inf_dict["rule_key"],
+        rule_name=inf_dict["rule_name"],
+        category=inf_dict["category"],
+        confidence=inf_dict["confidence"],
+        inference_text=inf_dict["inference_text"],
+        supporting_evidence=inf_dict["supporting_evidence"],
+        implications=inf_dict["implications"],
+        domains_used=[DOMAINS_BY_VALUE[d] for d in inf_dict["domains_used"]],
+        scariness_level=inf_dict["scariness_level"],
+        content_rating=CONTENT_RATINGS_BY_VALUE[inf_dict["content_rating"]],
+        educational_note=inf_dict.get("educational_note"),
+        real_world_example=inf_dict.get("real_world_example"),
+        victim_statements=[
+            VictimStatement.model_construct(**stmt)
+            for stmt in inf_dict.get("victim_statements", [])
+        ],
+    )
 
 
 @router.get(
@@ -77,7 +142,7 @@ async def get_inferences(
         default=None, description="Maximum content rating to include"
     ),
     db: AsyncSession = Depends(get_db),
-) -> InferencesResponse:
+) -> ORJSONResponse:
     """
     Get inferences for an NPC based on enabled domains.
 
@@ -85,7 +150,7 @@ async def get_inferences(
     Can be filtered by scariness level and content rating.
     """
     # Check if NPC exists
-    result = await db.execute(select(NPC).where(NPC.id == npc_id))
+    result = await db.execute(select(NPC).where(NPC.id == npc_id).options(raiseload("*")))
     npc = result.scalar_one_or_none()
     if not npc:
         raise HTTPException(status_code=404, detail=f"NPC with id {npc_id} not found")
@@ -94,49 +159,17 @@ async def get_inferences(
     engine = AdvancedInferenceEngine(db)
     inference_dicts = await engine.generate_inferences(npc_id, list(domains))
 
-    # Convert dict results to InferenceResult models
-    inferences = []
-    for inf_dict in inference_dicts:
-        # Convert victim statements to VictimStatement models
-        victim_statements = [
-            VictimStatement(**stmt) for stmt in inf_dict.get("victim_statements", [])
-        ]
-
-        # Convert domains_used strings back to DomainType enums
-        domains_used = [DomainType(d) for d in inf_dict["domains_used"]]
-
-        inference = InferenceResult(
-            rule_key=inf_dict["rule_key"],
-            rule_name=inf_dict["rule_name"],
-            category=inf_dict["category"],
-            confidence=inf_dict["confidence"],
-            inference_text=inf_dict["inference_text"],
-            supporting_evidence=inf_dict["supporting_evidence"],
-            implications=inf_dict["implications"],
-            domains_used=domains_used,
-            scariness_level=inf_dict["scariness_level"],
-            content_rating=ContentRating(inf_dict["content_rating"]),
-            educational_note=inf_dict.get("educational_note"),
-            real_world_example=inf_dict.get("real_world_example"),
-            victim_statements=victim_statements,
-        )
-        inferences.append(inference)
-
-    # Apply content filtering
-    if max_scariness is not None:
-        inferences = [i for i in inferences if i.scariness_level <= max_scariness]
-
-    if max_content_rating is not None:
-        # Define content rating hierarchy
-        rating_hierarchy = {
-            ContentRating.SAFE: 1,
-            ContentRating.CAUTIONARY: 2,
-            ContentRating.SERIOUS: 3,
-            ContentRating.DISTURBING: 4,
-            ContentRating.DYSTOPIAN: 5,
-        }
-        max_level = rating_hierarchy[max_content_rating]
-        inferences = [i for i in inferences if rating_hierarchy[i.content_rating] <= max_level]
+    # Apply content filtering in one pass, and only build models for what's kept.
+    # Unset limits fall back to the top of each scale.
+    scariness_limit = max_scariness if max_scariness is not None else 5
+    rating_limit = CONTENT_RATING_ORDER[max_content_rating or ContentRating.DYSTOPIAN]
+    inferences = [
+        _inference_from_engine(inf_dict)
+        for inf_dict in inference_dicts
+        if inf_dict["scariness_level"] <= scariness_limit
+        and CONTENT_RATING_ORDER[CONTENT_RATINGS_BY_VALUE[inf_dict["content_rating"]]]
+        <= rating_limit
+    ]
 
     # Calculate unlockable inferences by checking which rules would become available
     # with each additional domain
@@ -145,28 +178,28 @@ async def get_inferences(
     unlockable_inferences = []
 
     for domain in disabled_domains:
-        # Check which rules would be newly available with this domain
+        # Rules requiring this domain that it would complete. They can't already
+        # be available, since the domain itself is currently disabled.
         potential_domains = domains | {domain}
-        unlockable_rules = []
-
-        for rule in INFERENCE_RULES:
-            required_domains_set = set(rule["required_domains"])
-            # Rule is unlockable if it requires this domain and we now have all required domains
-            if domain in required_domains_set and required_domains_set.issubset(potential_domains):
-                # Make sure it's not already available with current domains
-                if not required_domains_set.issubset(domains):
-                    unlockable_rules.append(rule["rule_key"])
+        unlockable_rules = [
+            rule_key
+            for rule_key, required in RULES_BY_DOMAIN.get(domain, ())
+            if required <= potential_domains
+        ]
 
         if unlockable_rules:
             unlockable_inferences.append(
                 UnlockableInference(domain=domain, rule_keys=unlockable_rules)
             )
 
-    return InferencesResponse(
-        npc_id=npc_id,
-        enabled_domains=list(domains),
-        inferences=inferences,
-        unlockable_inferences=unlockable_inferences,
+    # The models above are already validated, so serialize them once directly
+    return ORJSONResponse(
+        {
+            "npc_id": str(npc_id),
+            "enabled_domains": [d.value for d in domains],
+            "inferences": [i.model_dump(mode="json") for i in inferences],
+            "unlockable_inferences": [u.model_dump(mode="json") for u in unlockable_inferences],
+        }
     )
 
 
@@ -182,7 +215,7 @@ async def preview_new_inferences(
     ),
     new_domain: DomainType = Query(..., description="Domain to preview enabling"),
     db: AsyncSession = Depends(get_db),
-) -> list[InferenceResult]:
+) -> ORJSONResponse:
     """
     Preview new inferences that would be unlocked by enabling a new domain.
 
@@ -190,46 +223,19 @@ async def preview_new_inferences(
     Returns only the NEW inferences, not ones already available.
     """
     # Check if NPC exists
-    result = await db.execute(select(NPC).where(NPC.id == npc_id))
+    result = await db.execute(select(NPC).where(NPC.id == npc_id).options(raiseload("*")))
     npc = result.scalar_one_or_none()
     if not npc:
         raise HTTPException(status_code=404, detail=f"NPC with id {npc_id} not found")
 
     engine = AdvancedInferenceEngine(db)
 
-    # Get inferences with current domains
-    current_inference_dicts = await engine.generate_inferences(npc_id, list(current_domains))
-    current_rule_keys = {inf["rule_key"] for inf in current_inference_dicts}
-
-    # Get inferences with new domain added
-    new_domains = current_domains | {new_domain}
-    new_inference_dicts = await engine.generate_inferences(npc_id, list(new_domains))
-
-    # Filter to only NEW inferences and convert to models
-    newly_unlocked = []
-    for inf_dict in new_inference_dicts:
-        if inf_dict["rule_key"] not in current_rule_keys:
-            # Convert to InferenceResult model
-            victim_statements = [
-                VictimStatement(**stmt) for stmt in inf_dict.get("victim_statements", [])
-            ]
-            domains_used = [DomainType(d) for d in inf_dict["domains_used"]]
-
-            inference = InferenceResult(
-                rule_key=inf_dict["rule_key"],
-                rule_name=inf_dict["rule_name"],
-                category=inf_dict["category"],
-                confidence=inf_dict["confidence"],
-                inference_text=inf_dict["inference_text"],
-                supporting_evidence=inf_dict["supporting_evidence"],
-                implications=inf_dict["implications"],
-                domains_used=domains_used,
-                scariness_level=inf_dict["scariness_level"],
-                content_rating=ContentRating(inf_dict["content_rating"]),
-                educational_note=inf_dict.get("educational_note"),
-                real_world_example=inf_dict.get("real_world_example"),
-                victim_statements=victim_statements,
-            )
-            newly_unlocked.append(inference)
+    # Domain data is loaded once and evaluated with and without the new domain
+    new_inference_dicts = await engine.generate_unlocked_inferences(
+        npc_id, list(current_domains), new_domain
+    )
+
+    # Convert the NEW inferences to models
+    newly_unlocked = [_inference_from_engine(inf_dict) for inf_dict in new_inference_dicts]
 
-    return newly_unlocked
+    return ORJSONResponse([i.model_dump(mode="json") for i in newly_unlocked])
@@ -1,13 +1,21 @@
 """NPC API endpoints."""
 
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple, TypeVar
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
+from datafusion.api.responses import ORJSONResponse
+from datafusion.cache import TTLCache, clear_when_recreated
 from datafusion.config import settings
-from datafusion.database import get_db
+from datafusion.database import any_of, engine, get_db
 from datafusion.models.finance import (
     FinanceRecord,
 )
@@ -22,43 +30,53 @@ from datafusion.models.npc import NPC
 from datafusion.models.social import (
     SocialMediaRecord,
 )
-from datafusion.schemas.domains import DomainType, NPCWithDomains
+from datafusion.schemas.domains import DomainData, DomainType, NPCBatchRequest, NPCWithDomains
 from datafusion.schemas.errors import ErrorResponse
 from datafusion.schemas.finance import (
     BankAccountRead,
     DebtRead,
     FinanceRecordFiltered,
-    FinanceRecordRead,
     TransactionRead,
 )
 from datafusion.schemas.health import (
     HealthConditionRead,
     HealthMedicationRead,
     HealthRecordFiltered,
-    HealthRecordRead,
     HealthVisitRead,
 )
 from datafusion.schemas.judicial import (
     CivilCaseRead,
     CriminalRecordRead,
     JudicialRecordFiltered,
-    JudicialRecordRead,
     TrafficViolationRead,
 )
 from datafusion.schemas.location import (
     InferredLocationRead,
     LocationRecordFiltered,
-    LocationRecordRead,
 )
-from datafusion.schemas.npc import NPCBasicRead, NPCBatchRequest, NPCListResponse, NPCRead
+from datafusion.schemas.npc import NPCBasicRead, NPCListResponse, NPCRead
 from datafusion.schemas.social import (
     PrivateInferenceRead,
     PublicInferenceRead,
     SocialMediaRecordFiltered,
-    SocialMediaRecordRead,
 )
 
-router = APIRouter(prefix="/npcs", tags=["npcs"])
+router = APIRouter(prefix="/npcs", tags=["npcs"], default_response_class=ORJSONResponse)
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# list_npcs reads only the columns NPCBasicRead serializes
+NPC_LIST_FIELDS = tuple(NPCBasicRead.model_fields)
+NPC_LIST_YIELD_PER = 200
+
+# Statements are built once at import; each request only binds its ids
+NPC_BY_ID = select(NPC).where(NPC.id == bindparam("npc_id"))
+NPCS_BY_IDS = select(NPC).where(any_of(NPC.id, "npc_ids", engine.dialect.name))
+
+# Serialized list pages keyed by (limit, offset). Writes from any process show
+# up once the TTL lapses.
+npc_list_cache = TTLCache(settings.npc_list_cache_size, settings.npc_list_cache_ttl)
+clear_when_recreated(npc_list_cache, NPC.__table__)
 
 
 @router.get("/", response_model=NPCListResponse)
@@ -70,22 +88,45 @@ async def list_npcs(
     ),
     offset: int = Query(default=0, ge=0),
     db: AsyncSession = Depends(get_db),
-):
-    """List all NPCs with pagination for map rendering."""
-    count_query = select(func.count()).select_from(NPC)
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    npcs_query = select(NPC).offset(offset).limit(limit)
-    result = await db.execute(npcs_query)
-    npcs = result.scalars().all()
-
-    return NPCListResponse(
-        items=[NPCBasicRead.model_validate(npc) for npc in npcs],
-        total=total,
-        limit=limit,
-        offset=offset,
+) -> Response:
+    """
+    List all NPCs with pagination for map rendering.
+
+    Pages are cached in-process for a few seconds (settings.npc_list_cache_ttl).
+    """
+    cache_key = (limit, offset)
+    content = npc_list_cache.get(cache_key)
+    if content is not None:
+        return Response(content=content, media_type="application/json")
+
+    # The window count rides along with the page, so one statement returns both
+    npcs_query = (
+        select(*(getattr(NPC, field) for field in NPC_LIST_FIELDS), func.count().over())
+        .offset(offset)
+        .limit(limit)
+        .execution_options(yield_per=NPC_LIST_YIELD_PER)
     )
+    result = await db.stream(npcs_query)
+
+    # Rows are serialized as they arrive, so only their JSON is held for the page
+    items = []
+    total = None
+    async for *values, total in result:
+        items.append(orjson.dumps(dict(zip(NPC_LIST_FIELDS, values))))
+
+    if total is None:
+        # Past the last page there is no row to carry the total
+        count_query = select(func.count()).select_from(NPC)
+        total = (await db.execute(count_query)).scalar_one() if offset else 0
+
+    content = b'{"items":[%b],"total":%d,"limit":%d,"offset":%d}' % (
+        b",".join(items),
+        total,
+        limit,
+        offset,
+    )
+    npc_list_cache.set(cache_key, content)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
@@ -97,46 +138,71 @@ async def get_npc(
     npc_id: UUID,
     domains: set[DomainType] = Query(default_factory=set),
     db: AsyncSession = Depends(get_db),
-):
+) -> ORJSONResponse:
     """Get NPC with requested domain data."""
-    npc_query = select(NPC).where(NPC.id == npc_id)
-    result = await db.execute(npc_query)
+    result = await db.execute(NPC_BY_ID, {"npc_id": npc_id})
     npc = result.scalar_one_or_none()
 
     if not npc:
         raise HTTPException(status_code=404, detail="NPC not found")
 
-    return await _build_npc_with_domains(npc, domains, db)
+    (npc_with_domains,) = await _build_npcs_with_domains([npc], domains, db)
+    return ORJSONResponse(npc_with_domains.model_dump(mode="json"))
+
+
+@router.get(
+    "/{npc_id}/full",
+    response_model=NPCWithDomains,
+    responses={404: {"model": ErrorResponse, "description": "NPC not found"}},
+)
+async def get_npc_full(
+    npc_id: UUID,
+    db: AsyncSession = Depends(get_db),
+) -> ORJSONResponse:
+    """
+    Get NPC with every domain, for the full profile view.
+
+    The NPC and all of its domain records come back from one joined query;
+    only the records' child lists are selectin-loaded, one query per list.
+    """
+    result = await db.execute(FULL_PROFILE_BY_ID, {"npc_id": npc_id})
+    npc = result.unique().scalar_one_or_none()
+
+    if not npc:
+        raise HTTPException(status_code=404, detail="NPC not found")
+
+    domain_data = {}
+    for domain, plan in DOMAIN_RECORDS.items():
+        record = getattr(npc, plan.npc_relationship)
+        if record is not None:
+            domain_data[domain] = plan.build_data(record)
+
+    npc_with_domains = NPCWithDomains(npc=NPCRead.model_validate(npc), domains=domain_data)
+    return ORJSONResponse(npc_with_domains.model_dump(mode="json"))
 
 
 @router.post("/batch", response_model=list[NPCWithDomains])
 async def get_npcs_batch(
     request: NPCBatchRequest,
     db: AsyncSession = Depends(get_db),
-) -> list[NPCWithDomains]:
+) -> ORJSONResponse:
     """Get multiple NPCs in a single request."""
     # Handle empty list
     if not request.npc_ids:
-        return []
+        return ORJSONResponse([])
 
     # Single query with WHERE id IN (...)
-    result = await db.execute(select(NPC).where(NPC.id.in_(request.npc_ids)))
+    result = await db.execute(NPCS_BY_IDS, {"npc_ids": list(request.npc_ids)})
     npcs = result.scalars().all()
 
-    # Convert domains list to set of DomainType enums (empty set if None)
-    domains_set: set[DomainType] = set()
-    if request.domains:
-        try:
-            domains_set = {DomainType(d) for d in request.domains}
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=f"Invalid domain type: {e}")
-
-    # Build response for each NPC
-    return [await _build_npc_with_domains(npc, domains_set, db) for npc in npcs]
+    # One query per requested domain covers every NPC in the batch
+    npcs_with_domains = await _build_npcs_with_domains(npcs, request.domains or set(), db)
+    return ORJSONResponse([npc.model_dump(mode="json") for npc in npcs_with_domains])
 
 
 @router.get(
     "/{npc_id}/domain/{domain}",
+    response_model=DomainData,
     responses={
         404: {"model": ErrorResponse, "description": "NPC or domain data not found"},
     },
@@ -145,234 +211,228 @@ async def get_npc_domain_data(
     npc_id: UUID,
     domain: DomainType,
     db: AsyncSession = Depends(get_db),
-):
+) -> ORJSONResponse:
     """Get specific domain data for an NPC."""
-    npc_query = select(NPC).where(NPC.id == npc_id)
-    result = await db.execute(npc_query)
+    result = await db.execute(NPC_BY_ID, {"npc_id": npc_id})
     npc = result.scalar_one_or_none()
 
     if not npc:
         raise HTTPException(status_code=404, detail="NPC not found")
 
-    if domain == DomainType.HEALTH:
-        health_data = await _get_health_data(npc_id, db)
-        if not health_data:
-            raise HTTPException(status_code=404, detail="Health record not found")
-        return health_data
-
-    if domain == DomainType.FINANCE:
-        finance_data = await _get_finance_data(npc_id, db)
-        if not finance_data:
-            raise HTTPException(status_code=404, detail="Finance record not found")
-        return finance_data
-
-    if domain == DomainType.JUDICIAL:
-        judicial_data = await _get_judicial_data(npc_id, db)
-        if not judicial_data:
-            raise HTTPException(status_code=404, detail="Judicial record not found")
-        return judicial_data
-
-    if domain == DomainType.LOCATION:
-        location_data = await _get_location_data(npc_id, db)
-        if not location_data:
-            raise HTTPException(status_code=404, detail="Location record not found")
-        return location_data
-
-    if domain == DomainType.SOCIAL:
-        social_data = await _get_social_data(npc_id, db)
-        if not social_data:
-            raise HTTPException(status_code=404, detail="Social media record not found")
-        return social_data
-
-    raise HTTPException(
-        status_code=500,
-        detail=f"Unexpected domain: {domain.value}",
-    )
+    data = await _get_domain_data(npc_id, domain, db)
+    if data is None:
+        raise HTTPException(status_code=404, detail=DOMAIN_RECORDS[domain].not_found)
+    return ORJSONResponse(data.model_dump(mode="json"))
 
 
 # Helper functions for fetching domain data
 
 
-async def _build_npc_with_domains(
-    npc: NPC,
-    domains: set[DomainType],
-    db: AsyncSession,
-) -> NPCWithDomains:
-    """Build NPCWithDomains response for a single NPC."""
-    domain_data = {}
+class DomainRecords(NamedTuple):
+    """How one domain's record is loaded and turned into its response."""
 
-    if DomainType.HEALTH in domains:
-        health_data = await _get_health_data(npc.id, db)
-        if health_data:
-            domain_data[DomainType.HEALTH] = health_data
-
-    if DomainType.FINANCE in domains:
-        finance_data = await _get_finance_data(npc.id, db)
-        if finance_data:
-            domain_data[DomainType.FINANCE] = finance_data
-
-    if DomainType.JUDICIAL in domains:
-        judicial_data = await _get_judicial_data(npc.id, db)
-        if judicial_data:
-            domain_data[DomainType.JUDICIAL] = judicial_data
-
-    if DomainType.LOCATION in domains:
-        location_data = await _get_location_data(npc.id, db)
-        if location_data:
-            domain_data[DomainType.LOCATION] = location_data
-
-    if DomainType.SOCIAL in domains:
-        social_data = await _get_social_data(npc.id, db)
-        if social_data:
-            domain_data[DomainType.SOCIAL] = social_data
-
-    return NPCWithDomains(
-        npc=NPCRead.model_validate(npc),
-        domains=domain_data,
-    )
+    record_model: Any
+    # NPC relationship holding the record
+    npc_relationship: str
+    # Child lists the response includes
+    children: tuple[Any, ...]
+    build_data: Callable[[Any], BaseModel]
+    not_found: str
 
 
-async def _get_health_data(npc_id: UUID, db: AsyncSession) -> HealthRecordFiltered | None:
-    """Fetch health record with all related data for an NPC using eager loading."""
-    health_query = select(HealthRecord).where(HealthRecord.npc_id == npc_id)
+def _record_options(plan: DomainRecords) -> list[ExecutableOption]:
+    """
+    Loader options for a domain record query.
 
-    result = await db.execute(health_query)
-    health_record = result.scalar_one_or_none()
+    The child lists its response includes are selectin-loaded, and any other
+    relationship access raises instead of lazy loading behind an await.
+    """
+    return [
+        *(selectinload(child).raiseload("*") for child in plan.children),
+        raiseload("*"),
+    ]
 
-    if not health_record:
-        return None
 
-    # Relationships are eagerly loaded via lazy="selectin" in model
-    # This eliminates N+1 queries - only 1 query for conditions, 1 for medications, 1 for visits
-    health_read = HealthRecordRead(
-        id=health_record.id,
-        npc_id=health_record.npc_id,
-        insurance_provider=health_record.insurance_provider,
-        primary_care_physician=health_record.primary_care_physician,
-        conditions=[HealthConditionRead.model_validate(c) for c in health_record.conditions],
-        medications=[HealthMedicationRead.model_validate(m) for m in health_record.medications],
-        visits=[HealthVisitRead.model_validate(v) for v in health_record.visits],
-        created_at=health_record.created_at,
-        updated_at=health_record.updated_at,
-    )
-
-    return HealthRecordFiltered.from_health_record(health_read, filter_sensitive=False)
+async def _get_domain_data(npc_id: UUID, domain: DomainType, db: AsyncSession) -> BaseModel | None:
+    """Fetch one domain's record with its child lists for an NPC."""
+    result = await db.execute(RECORD_BY_NPC[domain], {"npc_id": npc_id})
+    record = result.scalar_one_or_none()
 
+    if not record:
+        return None
 
-async def _get_finance_data(npc_id: UUID, db: AsyncSession) -> FinanceRecordFiltered | None:
-    """Fetch finance record with all related data for an NPC using eager loading."""
-    finance_query = select(FinanceRecord).where(FinanceRecord.npc_id == npc_id)
+    return DOMAIN_RECORDS[domain].build_data(record)
 
-    result = await db.execute(finance_query)
-    finance_record = result.scalar_one_or_none()
 
-    if not finance_record:
-        return None
+def _construct(schema: type[SchemaT], row: Any, **fields: Any) -> SchemaT:
+    """
+    Build schema from a loaded ORM row without validating it.
 
-    # Relationships are eagerly loaded via lazy="selectin" in model
-    finance_read = FinanceRecordRead(
-        id=finance_record.id,
-        npc_id=finance_record.npc_id,
-        employment_status=finance_record.employment_status,
-        employer_name=finance_record.employer_name,
-        annual_income=finance_record.annual_income,
-        credit_score=finance_record.credit_score,
-        bank_accounts=[BankAccountRead.model_validate(a) for a in finance_record.bank_accounts],
-        debts=[DebtRead.model_validate(d) for d in finance_record.debts],
-        transactions=[TransactionRead.model_validate(t) for t in finance_record.transactions],
-        created_at=finance_record.created_at,
-        updated_at=finance_record.updated_at,
-    )
+    Rows read back from the database already have the schema's types, so each
+    field is copied as is; fields supplies the nested lists.
+    """
+    values = {name: getattr(row, name) for name in schema.model_fields if name not in fields}
+    return schema.model_construct(**values, **fields)
 
-    return FinanceRecordFiltered.model_validate(finance_read)
 
+async def _build_npcs_with_domains(
+    npcs: Sequence[NPC],
+    domains: set[DomainType],
+    db: AsyncSession,
+) -> list[NPCWithDomains]:
+    """
+    Build NPCWithDomains responses for several NPCs.
+
+    Each requested domain is loaded with a single query for all NPCs, so the
+    number of round trips depends on the domains requested, not on the
+    number of NPCs.
+    """
+    domain_data: dict[UUID, dict[DomainType, Any]] = {npc.id: {} for npc in npcs}
+
+    for domain, plan in DOMAIN_RECORDS.items():
+        if domain not in domains or not domain_data:
+            continue
+        result = await db.execute(RECORDS_BY_NPCS[domain], {"npc_ids": list(domain_data)})
+        for record in result.scalars():
+            domain_data[record.npc_id][domain] = plan.build_data(record)
+
+    return [
+        NPCWithDomains(
+            npc=NPCRead.model_validate(npc),
+            domains=domain_data[npc.id],
+        )
+        for npc in npcs
+    ]
+
+
+def _health_data(health_record: HealthRecord) -> HealthRecordFiltered:
+    """Build the health response from a record with its related data loaded."""
+    # Child lists come from the caller's _record_options, one batched query each
+    return _construct(
+        HealthRecordFiltered,
+        health_record,
+        conditions=[_construct(HealthConditionRead, c) for c in health_record.conditions],
+        medications=[_construct(HealthMedicationRead, m) for m in health_record.medications],
+        visits=[_construct(HealthVisitRead, v) for v in health_record.visits],
+    )
 
-async def _get_judicial_data(npc_id: UUID, db: AsyncSession) -> JudicialRecordFiltered | None:
-    """Fetch judicial record with all related data for an NPC using eager loading."""
-    judicial_query = select(JudicialRecord).where(JudicialRecord.npc_id == npc_id)
 
-    result = await db.execute(judicial_query)
-    judicial_record = result.scalar_one_or_none()
+def _finance_data(finance_record: FinanceRecord) -> FinanceRecordFiltered:
+    """Build the finance response from a record with its related data loaded."""
+    # Child lists come from the caller's _record_options, one batched query each
+    return _construct(
+        FinanceRecordFiltered,
+        finance_record,
+        bank_accounts=[_construct(BankAccountRead, a) for a in finance_record.bank_accounts],
+        debts=[_construct(DebtRead, d) for d in finance_record.debts],
+        transactions=[_construct(TransactionRead, t) for t in finance_record.transactions],
+    )
 
-    if not judicial_record:
-        return None
 
-    # Relationships are eagerly loaded via lazy="selectin" in model
-    judicial_read = JudicialRecordRead(
-        id=judicial_record.id,
-        npc_id=judicial_record.npc_id,
-        has_criminal_record=judicial_record.has_criminal_record,
-        has_civil_cases=judicial_record.has_civil_cases,
-        has_traffic_violations=judicial_record.has_traffic_violations,
+def _judicial_data(judicial_record: JudicialRecord) -> JudicialRecordFiltered:
+    """Build the judicial response from a record with its related data loaded."""
+    # Child lists come from the caller's _record_options, one batched query each
+    return _construct(
+        JudicialRecordFiltered,
+        judicial_record,
         criminal_records=[
-            CriminalRecordRead.model_validate(c) for c in judicial_record.criminal_records
+            _construct(CriminalRecordRead, c) for c in judicial_record.criminal_records
         ],
-        civil_cases=[CivilCaseRead.model_validate(c) for c in judicial_record.civil_cases],
+        civil_cases=[_construct(CivilCaseRead, c) for c in judicial_record.civil_cases],
         traffic_violations=[
-            TrafficViolationRead.model_validate(t) for t in judicial_record.traffic_violations
+            _construct(TrafficViolationRead, t) for t in judicial_record.traffic_violations
         ],
-        created_at=judicial_record.created_at,
-        updated_at=judicial_record.updated_at,
     )
 
-    return JudicialRecordFiltered.model_validate(judicial_read)
-
 
-async def _get_location_data(npc_id: UUID, db: AsyncSession) -> LocationRecordFiltered | None:
-    """Fetch location record with all related data for an NPC using eager loading."""
-    location_query = select(LocationRecord).where(LocationRecord.npc_id == npc_id)
-
-    result = await db.execute(location_query)
-    location_record = result.scalar_one_or_none()
-
-    if not location_record:
-        return None
-
-    # Relationships are eagerly loaded via lazy="selectin" in model
-    location_read = LocationRecordRead(
-        id=location_record.id,
-        npc_id=location_record.npc_id,
-        tracking_enabled=location_record.tracking_enabled,
-        data_retention_days=location_record.data_retention_days,
+def _location_data(location_record: LocationRecord) -> LocationRecordFiltered:
+    """Build the location response from a record with its related data loaded."""
+    # Child lists come from the caller's _record_options, one batched query each
+    return _construct(
+        LocationRecordFiltered,
+        location_record,
         inferred_locations=[
-            InferredLocationRead.model_validate(i) for i in location_record.inferred_locations
+            _construct(InferredLocationRead, i) for i in location_record.inferred_locations
         ],
-        created_at=location_record.created_at,
-        updated_at=location_record.updated_at,
     )
 
-    return LocationRecordFiltered.model_validate(location_read)
-
-
-async def _get_social_data(npc_id: UUID, db: AsyncSession) -> SocialMediaRecordFiltered | None:
-    """Fetch social media record with all related data for an NPC using eager loading."""
-    social_query = select(SocialMediaRecord).where(SocialMediaRecord.npc_id == npc_id)
-
-    result = await db.execute(social_query)
-    social_record = result.scalar_one_or_none()
 
-    if not social_record:
-        return None
-
-    # Relationships are eagerly loaded via lazy="selectin" in model
-    social_read = SocialMediaRecordRead(
-        id=social_record.id,
-        npc_id=social_record.npc_id,
-        has_public_profile=social_record.has_public_profile,
-        primary_platform=social_record.primary_platform,
-        account_created_date=social_record.account_created_date,
-        follower_count=social_record.follower_count,
-        post_frequency=social_record.post_frequency,
-        uses_end_to_end_encryption=social_record.uses_end_to_end_encryption,
-        encryption_explanation=social_record.encryption_explanation,
+def _social_data(social_record: SocialMediaRecord) -> SocialMediaRecordFiltered:
+    """Build the social media response from a record with its related data loaded."""
+    # Child lists come from the caller's _record_options, one batched query each
+    return _construct(
+        SocialMediaRecordFiltered,
+        social_record,
         public_inferences=[
-            PublicInferenceRead.model_validate(p) for p in social_record.public_inferences
+            _construct(PublicInferenceRead, p) for p in social_record.public_inferences
         ],
         private_inferences=[
-            PrivateInferenceRead.model_validate(p) for p in social_record.private_inferences
+            _construct(PrivateInferenceRead, p) for p in social_record.private_inferences
         ],
-        created_at=social_record.created_at,
-        updated_at=social_record.updated_at,
     )
 
-    return SocialMediaRecordFiltered.model_validate(social_read)
+
+# Record plan for each domain, in response order
+DOMAIN_RECORDS = {
+    DomainType.HEALTH: DomainRecords(
+        HealthRecord,
+        "health_record",
+        (HealthRecord.conditions, HealthRecord.medications, HealthRecord.visits),
+        _health_data,
+        "Health record not found",
+    ),
+    DomainType.FINANCE: DomainRecords(
+        FinanceRecord,
+        "finance_record",
+        (FinanceRecord.bank_accounts, FinanceRecord.debts, FinanceRecord.transactions),
+        _finance_data,
+        "Finance record not found",
+    ),
+    DomainType.JUDICIAL: DomainRecords(
+        JudicialRecord,
+        "judicial_record",
+        (
+            JudicialRecord.criminal_records,
+            JudicialRecord.civil_cases,
+            JudicialRecord.traffic_violations,
+        ),
+        _judicial_data,
+        "Judicial record not found",
+    ),
+    DomainType.LOCATION: DomainRecords(
+        LocationRecord,
+        "location_record",
+        (LocationRecord.inferred_locations,),
+        _location_data,
+        "Location record not found",
+    ),
+    DomainType.SOCIAL: DomainRecords(
+        SocialMediaRecord,
+        "social_media_record",
+        (SocialMediaRecord.public_inferences, SocialMediaRecord.private_inferences),
+        _social_data,
+        "Social media record not found",
+    ),
+}
+
+RECORD_BY_NPC = {
+    domain: select(plan.record_model)
+    .where(plan.record_model.npc_id == bindparam("npc_id"))
+    .options(*_record_options(plan))
+    for domain, plan in DOMAIN_RECORDS.items()
+}
+RECORDS_BY_NPCS = {
+    domain: select(plan.record_model)
+    .where(any_of(plan.record_model.npc_id, "npc_ids", engine.dialect.name))
+    .options(*_record_options(plan))
+    for domain, plan in DOMAIN_RECORDS.items()
+}
+# The NPC joined to all of its domain records
+FULL_PROFILE_BY_ID = NPC_BY_ID.options(
+    *(
+        joinedload(getattr(NPC, plan.npc_relationship)).selectinload(child).raiseload("*")
+        for plan in DOMAIN_RECORDS.values()
+        for child in plan.children
+    ),
+    raiseload("*"),
+)
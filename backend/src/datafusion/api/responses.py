@@ -0,0 +1,43 @@
+"""Response classes shared by the API routers."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Handlers that return one of these directly skip FastAPI's response_model
+    validation and jsonable_encoder pass, so it is meant for content that is
+    already validated (plain dicts or ``model_dump(mode="json")`` output).
+    The route's response_model is still used for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def make_etag(content: bytes) -> str:
+    """Strong ETag for a response identified by content."""
+    return f'"{hashlib.sha256(content).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header already names etag."""
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match compares weakly, so a W/ prefix still matches
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """Empty 304 response repeating the validator headers."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
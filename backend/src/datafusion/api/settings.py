@@ -1,9 +1,12 @@
 """API endpoints for user settings and content warnings."""
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import JSONResponse
 
-from datafusion.content.scenario_warnings import get_scenario_warnings
+from datafusion.cache import LRUCache
+from datafusion.config import settings
+from datafusion.content.scenario_warnings import SCENARIO_WARNINGS
 from datafusion.schemas.settings import (
     ScenarioWarnings,
     UserSettings,
@@ -13,9 +16,18 @@ from datafusion.schemas.settings import (
 router = APIRouter()
 
 # In-memory settings storage (in production, use session/database)
-# Key: session_id (for now, using a default session)
-_settings_store: dict[str, UserSettings] = {}
+# Key: session_id (for now, using a default session). Only sessions that have
+# changed a setting are stored, and the least recently used are dropped.
+_settings_store = LRUCache(maxsize=settings.settings_store_size)
 DEFAULT_SESSION = "default"
+# Shared by every session without stored settings; updates copy it
+DEFAULT_SETTINGS = UserSettings()
+
+# Scenario warnings are static content, so each response body is built once at import
+SCENARIO_WARNINGS_JSON = {
+    key: orjson.dumps(warnings.model_dump(mode="json"))
+    for key, warnings in SCENARIO_WARNINGS.items()
+}
 
 
 @router.get("", response_model=UserSettings)
@@ -31,9 +43,7 @@ async def get_settings(
     Returns:
         Current user settings (or defaults if not set)
     """
-    if session_id not in _settings_store:
-        _settings_store[session_id] = UserSettings()
-    return _settings_store[session_id]
+    return _settings_store.get(session_id, DEFAULT_SETTINGS)
 
 
 @router.put("", response_model=UserSettings)
@@ -51,24 +61,20 @@ async def update_settings(
     Returns:
         Updated settings
     """
-    # Get current settings or create defaults
-    if session_id not in _settings_store:
-        _settings_store[session_id] = UserSettings()
-
-    current = _settings_store[session_id]
+    current = _settings_store.get(session_id, DEFAULT_SETTINGS)
 
     # Apply updates
     update_data = updates.model_dump(exclude_unset=True)
     updated = current.model_copy(update=update_data)
 
-    _settings_store[session_id] = updated
+    _settings_store.set(session_id, updated)
     return updated
 
 
 @router.get("/warnings/{scenario_key}", response_model=ScenarioWarnings)
 async def get_scenario_content_warnings(
     scenario_key: str,
-) -> ScenarioWarnings:
+) -> Response:
     """
     Get content warnings for a scenario.
 
@@ -81,13 +87,13 @@ async def get_scenario_content_warnings(
     Raises:
         HTTPException: If scenario not found
     """
-    warnings = get_scenario_warnings(scenario_key)
-    if warnings is None:
+    content = SCENARIO_WARNINGS_JSON.get(scenario_key)
+    if content is None:
         raise HTTPException(
             status_code=404,
             detail=f"Scenario '{scenario_key}' not found",
         )
-    return warnings
+    return Response(content=content, media_type="application/json")
 
 
 @router.post("/warnings/{scenario_key}/acknowledge", status_code=204)
@@ -109,8 +115,7 @@ async def acknowledge_warnings(
         In production, this would track acknowledgment in database/session
     """
     # Verify scenario exists
-    warnings = get_scenario_warnings(scenario_key)
-    if warnings is None:
+    if scenario_key not in SCENARIO_WARNINGS:
         raise HTTPException(
             status_code=404,
             detail=f"Scenario '{scenario_key}' not found",
@@ -8,15 +8,21 @@ and decision submission in System Mode.
 import asyncio
 import logging
 import random
-from datetime import UTC, datetime
-from uuid import UUID
+from collections import deque
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
-from datafusion.database import get_db
+from datafusion.api.responses import ORJSONResponse
+from datafusion.cache import TTLCache, clear_when_recreated
+from datafusion.config import settings
+from datafusion.database import get_db, insert_or_ignore
 from datafusion.models.finance import FinanceRecord
 from datafusion.models.health import HealthRecord
 from datafusion.models.judicial import JudicialRecord
@@ -104,21 +110,79 @@ from datafusion.services.time_progression import TimeProgressionService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/system", tags=["system"])
+router = APIRouter(prefix="/system", tags=["system"], default_response_class=ORJSONResponse)
+
+# Case lists reuse a citizen's cached risk score for this long
+CACHED_RISK_SCORE_MAX_AGE = timedelta(hours=1)
+
+# New operators always start active
+ACTIVE_STATUS = OperatorStatus.ACTIVE.value
+
+# Codes tried per session start before giving up
+OPERATOR_CODE_ATTEMPTS = 3
+
+# Operator codes not yet handed out by this process, in random order. Codes
+# used before a restart are skipped by start_system_mode's conflict handling.
+_operator_codes: deque[str] = deque()
+
+
+def _next_operator_code() -> str:
+    """Take the next unused operator code, reshuffling once all are taken."""
+    if not _operator_codes:
+        _operator_codes.extend(f"OP-{n}" for n in random.sample(range(1000, 10000), 9000))
+    return _operator_codes.popleft()
+
+
+# Every column _directive_to_read reads, for queries that only build a DirectiveRead
+DIRECTIVE_READ_COLUMNS = (
+    Directive.id,
+    Directive.directive_key,
+    Directive.week_number,
+    Directive.title,
+    Directive.description,
+    Directive.internal_memo,
+    Directive.required_domains,
+    Directive.flag_quota,
+    Directive.time_limit_hours,
+    Directive.moral_weight,
+    Directive.content_rating,
+)
+# Built once at import; the engine's compiled cache then reuses its SQL
+FIRST_DIRECTIVE_QUERY = select(*DIRECTIVE_READ_COLUMNS).where(Directive.week_number == 1).limit(1)
+
+# The week 1 directive's id and read model. Directives are seed data, but a
+# reseed from another process can replace them, so entries expire after a TTL.
+# Keyed by week number.
+first_directive_cache = TTLCache(1, settings.first_directive_cache_ttl)
+clear_when_recreated(first_directive_cache, Directive.__table__)
+
+
+async def _get_first_directive(db: AsyncSession) -> tuple[UUID, DirectiveRead] | None:
+    """The week 1 directive's id and read model, queried only on a cache miss."""
+    first_directive = first_directive_cache.get(1)
+    if first_directive is None:
+        directive_result = await db.execute(FIRST_DIRECTIVE_QUERY)
+        directive = directive_result.one_or_none()
+        if directive is None:
+            return None
+        first_directive = (directive.id, _directive_to_read(directive, show_memo=False))
+        first_directive_cache.set(1, first_directive)
+    return first_directive
+
+
+# Risk levels by 20-point band: 0-20, 21-40, 41-60, 61-80, 81+
+_RISK_LEVELS = (
+    RiskLevel.LOW,
+    RiskLevel.MODERATE,
+    RiskLevel.ELEVATED,
+    RiskLevel.HIGH,
+    RiskLevel.SEVERE,
+)
 
 
 def _risk_level_from_score(score: int) -> RiskLevel:
     """Convert risk score to risk level."""
-    if score >= 81:
-        return RiskLevel.SEVERE
-    elif score >= 61:
-        return RiskLevel.HIGH
-    elif score >= 41:
-        return RiskLevel.ELEVATED
-    elif score >= 21:
-        return RiskLevel.MODERATE
-    else:
-        return RiskLevel.LOW
+    return _RISK_LEVELS[min(max(score - 1, 0) // 20, 4)]
 
 
 # === Session Management ===
@@ -133,37 +197,46 @@ async def start_system_mode(
 
     Creates a new Operator and assigns the first directive.
     """
-    # Generate operator code
-    operator_code = f"OP-{random.randint(1000, 9999)}"
-
-    # Get first directive
-    directive_result = await db.execute(
-        select(Directive).where(Directive.week_number == 1).limit(1)
-    )
-    first_directive = directive_result.scalar_one_or_none()
-
-    if not first_directive:
+    first_directive = await _get_first_directive(db)
+    if first_directive is None:
         raise HTTPException(
             status_code=500, detail="No directives configured. Run seed_directives first."
         )
-
-    # Create operator
-    operator = Operator(
-        session_id=request.session_id,
-        operator_code=operator_code,
-        current_directive_id=first_directive.id,
-        status=OperatorStatus.ACTIVE,
-        compliance_score=85.0,
+    first_directive_id, first_directive_read = first_directive
+
+    # A Core insert skips the unit of work; the id is generated here, so no
+    # RETURNING round trip is needed to read it back
+    operator_id = uuid4()
+    compliance_score = 85.0
+    # Only an operator_code clash means "code taken"; any other conflict raises
+    insert_operator = insert_or_ignore(
+        Operator, db.bind.dialect.name, index_elements=[Operator.operator_code]
     )
-    db.add(operator)
-    await db.flush()
+    for _ in range(OPERATOR_CODE_ATTEMPTS):
+        # A code taken before a restart is skipped instead of failing the insert
+        operator_code = _next_operator_code()
+        result = await db.execute(
+            insert_operator.values(
+                id=operator_id,
+                session_id=request.session_id,
+                operator_code=operator_code,
+                current_directive_id=first_directive_id,
+                status=OperatorStatus.ACTIVE,
+                compliance_score=compliance_score,
+            )
+        )
+        if result.rowcount:
+            break
+    else:
+        raise HTTPException(status_code=503, detail="No operator code available. Try again.")
 
-    return SystemStartResponse(
-        operator_id=operator.id,
-        operator_code=operator.operator_code,
-        status=operator.status.value,
-        compliance_score=operator.compliance_score,
-        first_directive=_directive_to_read(first_directive, show_memo=False),
+    # Every field was just inserted or comes from the validated directive
+    return SystemStartResponse.model_construct(
+        operator_id=operator_id,
+        operator_code=operator_code,
+        status=ACTIVE_STATUS,
+        compliance_score=compliance_score,
+        first_directive=first_directive_read,
     )
 
 
@@ -182,13 +255,8 @@ async def get_dashboard(
     # Get operator
     operator = await _get_operator(operator_id, db)
 
-    # Get current directive
-    directive = None
-    if operator.current_directive_id:
-        directive_result = await db.execute(
-            select(Directive).where(Directive.id == operator.current_directive_id)
-        )
-        directive = directive_result.scalar_one_or_none()
+    # Joined in by _get_operator
+    directive = operator.current_directive
 
     # Calculate daily metrics
     metrics = await _calculate_daily_metrics(operator, db)
@@ -240,13 +308,8 @@ async def get_dashboard_with_cases(
     # Get operator
     operator = await _get_operator(operator_id, db)
 
-    # Get current directive
-    directive = None
-    if operator.current_directive_id:
-        directive_result = await db.execute(
-            select(Directive).where(Directive.id == operator.current_directive_id)
-        )
-        directive = directive_result.scalar_one_or_none()
+    # Joined in by _get_operator
+    directive = operator.current_directive
 
     # Calculate daily metrics
     metrics = await _calculate_daily_metrics(operator, db)
@@ -305,6 +368,8 @@ async def get_dashboard_with_cases(
 
     cases = []
     risk_scorer = RiskScorer(db)
+    # One clock read per request; scores updated after this are fresh
+    fresh_after = datetime.now(UTC) - CACHED_RISK_SCORE_MAX_AGE
 
     for npc in npcs:
         # Use cached risk score if available and fresh (< 1 hour old)
@@ -312,8 +377,7 @@ async def get_dashboard_with_cases(
         use_cached = (
             npc.cached_risk_score is not None
             and npc.risk_score_updated_at is not None
-            and (datetime.now(UTC) - npc.risk_score_updated_at.replace(tzinfo=UTC)).total_seconds()
-            < 3600
+            and npc.risk_score_updated_at.replace(tzinfo=UTC) > fresh_after
         )
 
         if use_cached:
@@ -332,7 +396,9 @@ async def get_dashboard_with_cases(
             try:
                 risk_assessment = await risk_scorer.calculate_risk_score(npc.id)
             except Exception as e:
-                logger.error(f"Failed to calculate risk score for NPC {npc.id}: {e}", exc_info=True)
+                logger.error(
+                    "Failed to calculate risk score for NPC %s: %s", npc.id, e, exc_info=True
+                )
                 # Use default risk assessment instead of skipping citizen
                 risk_assessment = RiskAssessment(
                     npc_id=npc.id,
@@ -391,11 +457,7 @@ async def get_current_directive(
     if not operator.current_directive_id:
         raise HTTPException(status_code=404, detail="No active directive")
 
-    directive_result = await db.execute(
-        select(Directive).where(Directive.id == operator.current_directive_id)
-    )
-    directive = directive_result.scalar_one_or_none()
-
+    directive = operator.current_directive
     if not directive:
         raise HTTPException(status_code=404, detail="Directive not found")
 
@@ -416,11 +478,7 @@ async def advance_directive(
     if not operator.current_directive_id:
         raise HTTPException(status_code=400, detail="No active directive")
 
-    # Get current directive
-    current_result = await db.execute(
-        select(Directive).where(Directive.id == operator.current_directive_id)
-    )
-    current_directive = current_result.scalar_one_or_none()
+    current_directive = operator.current_directive
 
     if not current_directive:
         raise HTTPException(status_code=404, detail="Current directive not found")
@@ -452,7 +510,8 @@ async def advance_directive(
         )
 
     # Update operator
-    operator.current_directive_id = next_directive.id
+    # Set through the relationship so the joined-in directive stays current
+    operator.current_directive = next_directive
     await db.flush()
 
     # Return next directive with internal memo of completed directive revealed
@@ -502,6 +561,8 @@ async def get_cases(
 
     cases = []
     risk_scorer = RiskScorer(db)
+    # One clock read per request; scores updated after this are fresh
+    fresh_after = datetime.now(UTC) - CACHED_RISK_SCORE_MAX_AGE
 
     for npc in npcs:
         # Use cached risk score if available and fresh (< 1 hour old)
@@ -509,8 +570,7 @@ async def get_cases(
         use_cached = (
             npc.cached_risk_score is not None
             and npc.risk_score_updated_at is not None
-            and (datetime.now(UTC) - npc.risk_score_updated_at.replace(tzinfo=UTC)).total_seconds()
-            < 3600
+            and npc.risk_score_updated_at.replace(tzinfo=UTC) > fresh_after
         )
 
         if use_cached:
@@ -529,7 +589,9 @@ async def get_cases(
             try:
                 risk_assessment = await risk_scorer.calculate_risk_score(npc.id)
             except Exception as e:
-                logger.error(f"Failed to calculate risk score for NPC {npc.id}: {e}", exc_info=True)
+                logger.error(
+                    "Failed to calculate risk score for NPC %s: %s", npc.id, e, exc_info=True
+                )
                 # Use default risk assessment instead of skipping citizen
                 risk_assessment = RiskAssessment(
                     npc_id=npc.id,
@@ -831,7 +893,7 @@ async def advance_time(operator_id: UUID, db: AsyncSession = Depends(get_db)):
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Error advancing time for operator {operator_id}: {e}")
+        logger.error("Error advancing time for operator %s: %s", operator_id, e)
         raise HTTPException(status_code=500, detail="Failed to advance time")
 
 
@@ -890,7 +952,7 @@ async def get_operator_history(
             summary = await outcome_gen.generate_outcome_summary(flag)
             one_line = summary.one_line_summary
         except Exception as e:
-            logger.warning(f"Failed to generate outcome summary for flag {flag.id}: {e}")
+            logger.warning("Failed to generate outcome summary for flag %s: %s", flag.id, e)
             one_line = "Outcome pending"
 
         summaries.append(
@@ -976,34 +1038,73 @@ async def acknowledge_ending(
 
 
 async def _get_operator(operator_id: UUID, db: AsyncSession) -> Operator:
-    """Get operator by ID or raise 404."""
-    result = await db.execute(select(Operator).where(Operator.id == operator_id))
+    """Get operator by ID, with its current directive joined in, or raise 404."""
+    result = await db.execute(
+        select(Operator)
+        .options(joinedload(Operator.current_directive))
+        .where(Operator.id == operator_id)
+    )
     operator = result.scalar_one_or_none()
     if not operator:
         raise HTTPException(status_code=404, detail="Operator not found")
     return operator
 
 
-def _directive_to_read(directive: Directive, show_memo: bool = False) -> DirectiveRead:
-    """Convert Directive model to DirectiveRead schema.
+def _directive_to_read(directive: Directive | Row[Any], show_memo: bool = False) -> DirectiveRead:
+    """Convert Directive model (or a DIRECTIVE_READ_COLUMNS row) to DirectiveRead schema.
 
     Internal memos are revealed from week 3 onwards, showing the regime's
     true intentions as the operator proves their compliance.
     """
     # Show internal memos from week 3+ to reveal regime's true intentions
     reveal_memo = show_memo or directive.week_number >= 3
+    return _directive_read(
+        directive.id,
+        directive.directive_key,
+        directive.week_number,
+        directive.title,
+        directive.description,
+        directive.internal_memo if reveal_memo else None,
+        tuple(directive.required_domains),
+        directive.flag_quota,
+        directive.time_limit_hours,
+        directive.moral_weight,
+        directive.content_rating,
+    )
+
+
+@lru_cache(maxsize=512)
+def _directive_read(
+    directive_id: UUID,
+    directive_key: str,
+    week_number: int,
+    title: str,
+    description: str,
+    internal_memo: str | None,
+    required_domains: tuple[str, ...],
+    flag_quota: int,
+    time_limit_hours: int | None,
+    moral_weight: int,
+    content_rating: str,
+) -> DirectiveRead:
+    """
+    Build a DirectiveRead, reused while the directive's fields stay the same.
+
+    Keyed on every field rather than the id, so an edited directive gets a new
+    entry. DirectiveRead is frozen, so the shared result can't be mutated.
+    """
     return DirectiveRead(
-        id=directive.id,
-        directive_key=directive.directive_key,
-        week_number=directive.week_number,
-        title=directive.title,
-        description=directive.description,
-        internal_memo=directive.internal_memo if reveal_memo else None,
-        required_domains=directive.required_domains,
-        flag_quota=directive.flag_quota,
-        time_limit_hours=directive.time_limit_hours,
-        moral_weight=directive.moral_weight,
-        content_rating=directive.content_rating,
+        id=directive_id,
+        directive_key=directive_key,
+        week_number=week_number,
+        title=title,
+        description=description,
+        internal_memo=internal_memo,
+        required_domains=required_domains,
+        flag_quota=flag_quota,
+        time_limit_hours=time_limit_hours,
+        moral_weight=moral_weight,
+        content_rating=content_rating,
     )
 
 
@@ -1022,13 +1123,8 @@ async def _calculate_daily_metrics(operator: Operator, db: AsyncSession) -> Dail
 
     # Get quota from directive
     quota = 0
-    if operator.current_directive_id:
-        directive_result = await db.execute(
-            select(Directive).where(Directive.id == operator.current_directive_id)
-        )
-        directive = directive_result.scalar_one_or_none()
-        if directive:
-            quota = directive.flag_quota
+    if operator.current_directive:
+        quota = operator.current_directive.flag_quota
 
     # Get average decision time
     avg_result = await db.execute(
@@ -1116,13 +1212,8 @@ async def _get_domain_data(npc_id: UUID, operator: Operator, db: AsyncSession) -
 
     # Get directive to check access
     accessible_domains = ["location"]  # Default
-    if operator.current_directive_id:
-        directive_result = await db.execute(
-            select(Directive).where(Directive.id == operator.current_directive_id)
-        )
-        directive = directive_result.scalar_one_or_none()
-        if directive:
-            accessible_domains = directive.required_domains
+    if operator.current_directive:
+        accessible_domains = operator.current_directive.required_domains
 
     # Build parallel query tasks for all accessible domains
     query_tasks = {}
@@ -1165,7 +1256,9 @@ async def _get_domain_data(npc_id: UUID, operator: Operator, db: AsyncSession) -
         for (domain_name, _), result in zip(query_tasks.items(), results):
             # Handle exceptions
             if isinstance(result, Exception):
-                logger.warning(f"Failed to fetch {domain_name} data for NPC {npc_id}: {result}")
+                logger.warning(
+                    "Failed to fetch %s data for NPC %s: %s", domain_name, npc_id, result
+                )
                 continue
 
             # Extract record from result
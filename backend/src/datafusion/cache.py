@@ -0,0 +1,86 @@
+"""Small in-process caches for hot, rarely changing API responses."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from sqlalchemy import Table, event
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry when full."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for key, or default if it is not cached."""
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            return default
+        return self._entries[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TTLCache:
+    """
+    LRU cache whose entries also expire ttl seconds after they are stored.
+
+    Entries live in this process only, so the TTL bounds how stale a cached
+    value can be when another process changes the underlying data. A ttl of
+    zero disables caching.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+def clear_when_recreated(cache: TTLCache, table: Table) -> None:
+    """
+    Clear cache whenever this process creates or drops table.
+
+    Recreating a table (resets, tests) empties it at once, so waiting out the
+    TTL would serve rows that no longer exist. Ordinary writes are left to the
+    TTL, which also covers writes from other processes.
+    """
+    event.listen(table, "after_create", lambda *args, **kwargs: cache.clear())
+    event.listen(table, "after_drop", lambda *args, **kwargs: cache.clear())
@@ -13,9 +13,18 @@ class Settings(BaseSettings):
     )
 
     database_url: str = "sqlite+aiosqlite:///./datafusion.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    # Seconds a request waits for a pooled connection before failing
+    db_pool_timeout: float = 30.0
+    # Seconds before a pooled connection is replaced, ahead of server-side idle timeouts
+    db_pool_recycle: int = 3600
     api_prefix: str = "/api"
     debug: bool = True
     cors_origins: list[str] = ["http://localhost:5173"]
+    # Explicit lists let CORS preflights use set lookups instead of echoing wildcards
+    cors_allow_methods: list[str] = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
+    cors_allow_headers: list[str] = ["Content-Type", "Authorization"]
 
     app_name: str = "DataFusion World API"
     app_version: str = "0.1.0"
@@ -25,5 +34,15 @@ class Settings(BaseSettings):
     min_page_size: int = 1
     max_page_size: int = 1000
 
+    # In-process cache of serialized NPC list pages; 0 disables it
+    npc_list_cache_ttl: float = 5.0
+    npc_list_cache_size: int = 256
+
+    # Seconds the week 1 directive is reused by session starts; 0 disables it
+    first_directive_cache_ttl: float = 10.0
+
+    # Sessions whose settings are kept in memory; the least recently used are dropped
+    settings_store_size: int = 10_000
+
 
 settings = Settings()
@@ -14,8 +14,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from datafusion.models.system_mode import Directive
 
-# The escalating mission structure of System Mode
-DIRECTIVES = [
+# The escalating mission structure of System Mode. Frozen as a tuple: the
+# content is fixed, so the lookups below are derived from it once at import.
+DIRECTIVES: tuple[dict, ...] = (
     {
         "directive_key": "week1_drug_activity",
         "week_number": 1,
@@ -237,7 +238,10 @@ DIRECTIVES = [
         "content_rating": "severe",
         "unlock_condition": {"type": "week_complete", "week": 8},
     },
-]
+)
+
+_DIRECTIVES_BY_WEEK = {directive["week_number"]: directive for directive in DIRECTIVES}
+_DIRECTIVE_KEYS = tuple(directive["directive_key"] for directive in DIRECTIVES)
 
 
 async def seed_directives(db: AsyncSession) -> list[Directive]:
@@ -297,12 +301,9 @@ def get_directive_by_week(week_number: int) -> dict | None:
     Returns:
         Directive data dict or None if not found
     """
-    for directive in DIRECTIVES:
-        if directive["week_number"] == week_number:
-            return directive
-    return None
+    return _DIRECTIVES_BY_WEEK.get(week_number)
 
 
 def get_all_directive_keys() -> list[str]:
     """Get list of all directive keys."""
-    return [d["directive_key"] for d in DIRECTIVES]
+    return list(_DIRECTIVE_KEYS)
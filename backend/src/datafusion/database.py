@@ -1,20 +1,75 @@
 """Database configuration and SQLAlchemy setup."""
 
+import asyncio
 from datetime import datetime
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import ColumnElement, DateTime, Insert, bindparam, event, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from datafusion.config import settings
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True,
-)
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """Build engine keyword arguments for the configured backend."""
+    url = make_url(database_url)
+    options: dict[str, Any] = {
+        "echo": settings.debug,
+        "future": True,
+        "pool_pre_ping": True,
+    }
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        # A local file connection can't be dropped by a server, so skip the
+        # liveness round trip on every checkout
+        options["pool_pre_ping"] = False
+        # Every connection to an in-memory database is a separate database,
+        # so it must keep SQLAlchemy's default single-connection pool.
+        if url.database in (None, "", ":memory:"):
+            return options
+    options.update(
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    return options
+
+
+engine = create_async_engine(settings.database_url, **_engine_options(settings.database_url))
+
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Enable WAL, a larger page cache and in-memory temp storage per SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+async def warm_pool() -> None:
+    """
+    Open the pool's steady-state connections before the first request.
+
+    Checking them all out at once makes the pool create each one, so early
+    requests reuse a connection instead of paying for the connect.
+    """
+    if not isinstance(engine.pool, AsyncAdaptedQueuePool):
+        return
+    connections = await asyncio.gather(*(engine.connect() for _ in range(settings.db_pool_size)))
+    await asyncio.gather(*(connection.close() for connection in connections))
+
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -55,8 +110,37 @@ class TimestampMixin:
     )
 
 
+def insert_or_ignore(
+    model: type, dialect_name: str, index_elements: list[Any] | None = None
+) -> Insert:
+    """
+    Build an INSERT that silently skips rows violating a unique constraint.
+
+    Both supported backends spell this ON CONFLICT DO NOTHING, but the
+    construct lives in each dialect's own insert(). With index_elements only
+    a conflict on that unique index is skipped; any other still raises.
+    """
+    if dialect_name == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing(index_elements=index_elements)
+    return sqlite.insert(model).on_conflict_do_nothing(index_elements=index_elements)
+
+
+def any_of(column: Any, name: str, dialect_name: str) -> ColumnElement[bool]:
+    """
+    Match column against a list of values bound under name.
+
+    PostgreSQL compares against one array parameter (``= ANY(:name)``), so
+    the statement text and its server-side plan are the same for every list
+    length. SQLite has no arrays and gets an expanding IN list instead.
+    """
+    if dialect_name == "postgresql":
+        return column == func.any(bindparam(name, type_=postgresql.ARRAY(column.type)))
+    return column.in_(bindparam(name, expanding=True))
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database sessions."""
+    # Leaving the block closes the session, so only commit/rollback is explicit
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -64,5 +148,8 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+# Register every model with Base.metadata so create_all/drop_all always see the
+# full schema, whichever module imported the database first.
+from datafusion import models  # noqa: E402, F401
@@ -1,15 +1,60 @@
 """Data generators package for creating synthetic NPCs and records."""
 
+from collections.abc import Iterator
+from typing import NamedTuple
 from uuid import uuid4
 
 from datafusion.generators.finance import generate_finance_record
 from datafusion.generators.health import generate_health_record
-from datafusion.generators.identity import generate_identity, generate_population
+from datafusion.generators.identity import (
+    generate_identity,
+    generate_population,
+    iter_identities,
+)
 from datafusion.generators.judicial import generate_judicial_record
 from datafusion.generators.location import generate_location_record
 from datafusion.generators.social import generate_social_media_record
 
 
+class PopulationBundle(NamedTuple):
+    """One generated NPC together with all of its domain records."""
+
+    npc: dict
+    health: dict
+    finance: dict
+    judicial: dict
+    location: dict
+    social: dict
+
+
+def iter_population(count: int, seed: int | None = None) -> Iterator[PopulationBundle]:
+    """
+    Yield the population one NPC bundle at a time.
+
+    Each bundle holds an NPC with all its domain records, so callers can
+    stream rows into the database without materializing the population.
+    """
+    for i, identity in enumerate(iter_identities(count, seed)):
+        npc_id = uuid4()
+
+        def domain_seed(offset: int) -> int | None:
+            return seed + i + offset if seed is not None else None
+
+        yield PopulationBundle(
+            npc={**identity, "id": npc_id},
+            health=generate_health_record(npc_id, domain_seed(1000)),
+            finance=generate_finance_record(npc_id, domain_seed(2000)),
+            judicial=generate_judicial_record(npc_id, domain_seed(3000)),
+            location=generate_location_record(npc_id, domain_seed(4000)),
+            social=generate_social_media_record(npc_id, domain_seed(5000)),
+        )
+
+
+def generate_population_bundles(count: int, seed: int | None = None) -> list[PopulationBundle]:
+    """Generate complete population as a list of per-NPC bundles."""
+    return list(iter_population(count, seed))
+
+
 def generate_full_population(count: int, seed: int | None = None) -> dict:
     """
     Generate complete population with NPCs and all domain records.
@@ -21,54 +66,19 @@ def generate_full_population(count: int, seed: int | None = None) -> dict:
     - judicial_records: dict mapping npc_id -> judicial record dict
     - location_records: dict mapping npc_id -> location record dict
     - social_media_records: dict mapping npc_id -> social media record dict
-    """
-    identities = generate_population(count, seed)
-
-    npcs = []
-    health_records = {}
-    finance_records = {}
-    judicial_records = {}
-    location_records = {}
-    social_media_records = {}
-
-    for i, identity in enumerate(identities):
-        npc_id = uuid4()
-
-        npc_data = {**identity, "id": npc_id}
-        npcs.append(npc_data)
 
-        # Generate health records
-        health_seed = seed + i + 1000 if seed is not None else None
-        health_record = generate_health_record(npc_id, health_seed)
-        health_records[str(npc_id)] = health_record
-
-        # Generate finance records
-        finance_seed = seed + i + 2000 if seed is not None else None
-        finance_record = generate_finance_record(npc_id, finance_seed)
-        finance_records[str(npc_id)] = finance_record
-
-        # Generate judicial records
-        judicial_seed = seed + i + 3000 if seed is not None else None
-        judicial_record = generate_judicial_record(npc_id, judicial_seed)
-        judicial_records[str(npc_id)] = judicial_record
-
-        # Generate location records
-        location_seed = seed + i + 4000 if seed is not None else None
-        location_record = generate_location_record(npc_id, location_seed)
-        location_records[str(npc_id)] = location_record
-
-        # Generate social media records
-        social_seed = seed + i + 5000 if seed is not None else None
-        social_record = generate_social_media_record(npc_id, social_seed)
-        social_media_records[str(npc_id)] = social_record
+    Record maps are keyed by the NPC's UUID, the same value as ``npc["id"]``,
+    so lookups need no string conversion.
+    """
+    bundles = generate_population_bundles(count, seed)
 
     return {
-        "npcs": npcs,
-        "health_records": health_records,
-        "finance_records": finance_records,
-        "judicial_records": judicial_records,
-        "location_records": location_records,
-        "social_media_records": social_media_records,
+        "npcs": [bundle.npc for bundle in bundles],
+        "health_records": {b.npc["id"]: b.health for b in bundles},
+        "finance_records": {b.npc["id"]: b.finance for b in bundles},
+        "judicial_records": {b.npc["id"]: b.judicial for b in bundles},
+        "location_records": {b.npc["id"]: b.location for b in bundles},
+        "social_media_records": {b.npc["id"]: b.social for b in bundles},
     }
 
 
@@ -81,4 +91,8 @@ __all__ = [
     "generate_location_record",
     "generate_social_media_record",
     "generate_full_population",
+    "generate_population_bundles",
+    "iter_identities",
+    "iter_population",
+    "PopulationBundle",
 ]
@@ -2,7 +2,7 @@
 
 import random
 from decimal import Decimal
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from faker import Faker
 
@@ -90,6 +90,7 @@ def generate_finance_record(npc_id: UUID, seed: int | None = None) -> dict:
         credit_score = random.randint(500, 680)
 
     record = {
+        "id": uuid4(),
         "npc_id": npc_id,
         "employment_status": employment_status,
         "employer_name": employer_name,
@@ -1,7 +1,7 @@
 """Health record data generator for NPCs."""
 
 import random
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from faker import Faker
 
@@ -28,6 +28,7 @@ def generate_health_record(npc_id: UUID, seed: int | None = None) -> dict:
     insurance_providers = _HEALTH_REF["insurance_providers"]
 
     record = {
+        "id": uuid4(),
         "npc_id": npc_id,
         "insurance_provider": random.choice(insurance_providers),
         "primary_care_physician": f"Dr. {fake.last_name()}",
@@ -1,6 +1,7 @@
 """Identity data generator for NPCs."""
 
 import random
+from collections.abc import Iterator
 from datetime import date
 
 from faker import Faker
@@ -70,10 +71,16 @@ def generate_identity(seed: int | None = None) -> dict:
     }
 
 
-def generate_population(count: int, seed: int | None = None) -> list[dict]:
-    """Generate multiple NPC identities with deterministic output when seeded."""
+def iter_identities(count: int, seed: int | None = None) -> Iterator[dict]:
+    """Yield NPC identities one at a time with deterministic output when seeded."""
     if seed is not None:
         Faker.seed(seed)
         random.seed(seed)
 
-    return [generate_identity(seed=seed + i if seed else None) for i in range(count)]
+    for i in range(count):
+        yield generate_identity(seed=seed + i if seed else None)
+
+
+def generate_population(count: int, seed: int | None = None) -> list[dict]:
+    """Generate multiple NPC identities with deterministic output when seeded."""
+    return list(iter_identities(count, seed))
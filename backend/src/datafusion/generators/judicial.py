@@ -2,7 +2,7 @@
 
 import random
 from decimal import Decimal
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from faker import Faker
 
@@ -71,6 +71,7 @@ def generate_judicial_record(npc_id: UUID, seed: int | None = None) -> dict:
         random.seed(seed)
 
     record = {
+        "id": uuid4(),
         "npc_id": npc_id,
         "has_criminal_record": False,
         "has_civil_cases": False,
@@ -2,7 +2,7 @@
 
 import random
 from datetime import time
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from faker import Faker
 
@@ -63,6 +63,7 @@ def generate_location_record(npc_id: UUID, seed: int | None = None) -> dict:
     tracking_enabled = random.random() > 0.10
 
     record = {
+        "id": uuid4(),
         "npc_id": npc_id,
         "tracking_enabled": tracking_enabled,
         "data_retention_days": random.choice([30, 60, 90, 180]),
@@ -8,7 +8,7 @@ surveillance works and why it's dangerous.
 
 import random
 from datetime import UTC, datetime, timedelta
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -154,6 +154,8 @@ class MessageGenerator:
     def __init__(self, db: AsyncSession):
         """Initialize with database session."""
         self.db = db
+        # Per-instance RNG so concurrent generators stay reproducible
+        self.rng = random.Random()
 
     async def generate_message_history(
         self, npc_id: UUID, seed: int | None = None
@@ -169,7 +171,7 @@ class MessageGenerator:
             MessageRecord with generated messages
         """
         if seed is not None:
-            random.seed(seed)
+            self.rng.seed(seed)
 
         # Get NPC data
         npc = await self._get_npc(npc_id)
@@ -178,13 +180,13 @@ class MessageGenerator:
         health_record = await self._get_health_record(npc_id)
         social_record = await self._get_social_record(npc_id)
 
-        # Create message record
-        message_record = MessageRecord(npc_id=npc_id)
+        # Create message record; the client-side id lets messages reference it
+        # without a flush
+        message_record = MessageRecord(id=uuid4(), npc_id=npc_id)
         self.db.add(message_record)
-        await self.db.flush()
 
         # Generate 20-50 messages over past 30 days
-        num_messages = random.randint(20, 50)
+        num_messages = self.rng.randint(20, 50)
         messages = []
 
         # Determine message profile based on NPC data
@@ -214,14 +216,14 @@ class MessageGenerator:
         # Generate messages
         for i in range(num_messages):
             # Timestamp: Random time in past 30 days
-            days_ago = random.uniform(0, 30)
+            days_ago = self.rng.uniform(0, 30)
             timestamp = datetime.now(UTC) - timedelta(days=days_ago)
 
             # Choose message category based on profile
             weights = self._get_message_weights(
                 has_mental_health, has_financial_stress, is_activist
             )
-            category = random.choices(list(weights.keys()), weights=list(weights.values()))[0]
+            category = self.rng.choices(list(weights.keys()), weights=list(weights.values()))[0]
 
             # Generate message content
             content = self._generate_message_content(category)
@@ -263,7 +265,7 @@ class MessageGenerator:
         )
 
         # Foreign contacts (placeholder - would need country data)
-        message_record.foreign_contact_count = random.randint(0, 3)
+        message_record.foreign_contact_count = self.rng.randint(0, 3)
 
         await self.db.flush()
         return message_record
@@ -297,9 +299,8 @@ class MessageGenerator:
 
     async def _generate_jessica_messages(self, npc_id: UUID) -> None:
         """Generate Jessica's narrative messages."""
-        message_record = MessageRecord(npc_id=npc_id)
+        message_record = MessageRecord(id=uuid4(), npc_id=npc_id)
         self.db.add(message_record)
-        await self.db.flush()
 
         jessica_messages = [
             ("I feel like someone's watching me. Is that paranoid?", -0.6, ["watching"], 7),
@@ -363,9 +364,8 @@ class MessageGenerator:
 
     async def _generate_david_messages(self, npc_id: UUID) -> None:
         """Generate David's angry venting messages."""
-        message_record = MessageRecord(npc_id=npc_id)
+        message_record = MessageRecord(id=uuid4(), npc_id=npc_id)
         self.db.add(message_record)
-        await self.db.flush()
 
         david_messages = [
             (
@@ -428,9 +428,8 @@ class MessageGenerator:
 
     async def _generate_senator_messages(self, npc_id: UUID) -> None:
         """Generate Senator's coordination messages (different kind of concerning)."""
-        message_record = MessageRecord(npc_id=npc_id)
+        message_record = MessageRecord(id=uuid4(), npc_id=npc_id)
         self.db.add(message_record)
-        await self.db.flush()
 
         senator_messages = [
             ("Meeting with pharma lobbyists went well. They're on board.", 0.4, [], 6),
@@ -492,31 +491,31 @@ class MessageGenerator:
     def _generate_message_content(self, category: str) -> str:
         """Generate message content based on category."""
         if category == "mundane":
-            return random.choice(MUNDANE_MESSAGES)
+            return self.rng.choice(MUNDANE_MESSAGES)
         elif category == "venting":
-            return random.choice(VENTING_MESSAGES)
+            return self.rng.choice(VENTING_MESSAGES)
         elif category == "work":
-            return random.choice(WORK_COMPLAINTS)
+            return self.rng.choice(WORK_COMPLAINTS)
         elif category == "mental_health":
-            return random.choice(MENTAL_HEALTH_MESSAGES)
+            return self.rng.choice(MENTAL_HEALTH_MESSAGES)
         elif category == "financial":
-            return random.choice(FINANCIAL_STRESS_MESSAGES)
+            return self.rng.choice(FINANCIAL_STRESS_MESSAGES)
         elif category == "organizing":
-            return random.choice(ORGANIZING_MESSAGES)
+            return self.rng.choice(ORGANIZING_MESSAGES)
         else:
-            return random.choice(MUNDANE_MESSAGES)
+            return self.rng.choice(MUNDANE_MESSAGES)
 
     def _generate_recipient(self, npc: NPC) -> tuple[str, str]:
         """Generate recipient name and relationship."""
         relationships = ["friend", "family", "coworker", "unknown"]
         names = ["Alex", "Sam", "Jordan", "Morgan", "Casey", "Taylor", "Riley", "Jamie"]
 
-        relationship = random.choice(relationships)
-        name = random.choice(names)
+        relationship = self.rng.choice(relationships)
+        name = self.rng.choice(names)
 
         # Personalize based on relationship
         if relationship == "family":
-            name = random.choice(["Mom", "Dad", "Sister", "Brother", "Aunt", "Uncle"])
+            name = self.rng.choice(["Mom", "Dad", "Sister", "Brother", "Aunt", "Uncle"])
 
         return name, relationship
 
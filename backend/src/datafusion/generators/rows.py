@@ -0,0 +1,121 @@
+"""
+Flatten generated population bundles into per-table insert rows.
+
+Every generated record carries a client-side UUID, so child rows can be joined
+to their parents here and handed straight to an ``insert(Model)`` executemany
+without any flush round-trips or re-keying by NPC id.
+"""
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from datafusion.generators import PopulationBundle
+from datafusion.models.finance import BankAccount, Debt, FinanceRecord, Transaction
+from datafusion.models.health import (
+    HealthCondition,
+    HealthMedication,
+    HealthRecord,
+    HealthVisit,
+)
+from datafusion.models.judicial import (
+    CivilCase,
+    CriminalRecord,
+    JudicialRecord,
+    TrafficViolation,
+)
+from datafusion.models.location import InferredLocation, LocationRecord
+from datafusion.models.npc import NPC
+from datafusion.models.social import (
+    PrivateInference,
+    PublicInference,
+    SocialMediaRecord,
+)
+
+
+class DomainPlan(NamedTuple):
+    """How one generated domain record maps onto its tables."""
+
+    record_model: type
+    foreign_key: str
+    # (child model, key of the child list in the generated record)
+    children: tuple[tuple[type, str], ...]
+
+
+# Table plan per population domain, keyed by PopulationBundle field
+DOMAIN_PLANS = {
+    "health": DomainPlan(
+        HealthRecord,
+        "health_record_id",
+        (
+            (HealthCondition, "conditions"),
+            (HealthMedication, "medications"),
+            (HealthVisit, "visits"),
+        ),
+    ),
+    "finance": DomainPlan(
+        FinanceRecord,
+        "finance_record_id",
+        ((BankAccount, "bank_accounts"), (Debt, "debts"), (Transaction, "transactions")),
+    ),
+    "judicial": DomainPlan(
+        JudicialRecord,
+        "judicial_record_id",
+        (
+            (CriminalRecord, "criminal_records"),
+            (CivilCase, "civil_cases"),
+            (TrafficViolation, "traffic_violations"),
+        ),
+    ),
+    "location": DomainPlan(
+        LocationRecord,
+        "location_record_id",
+        ((InferredLocation, "inferred_locations"),),
+    ),
+    "social": DomainPlan(
+        SocialMediaRecord,
+        "social_media_record_id",
+        ((PublicInference, "public_inferences"), (PrivateInference, "private_inferences")),
+    ),
+}
+DOMAINS = tuple(DOMAIN_PLANS)
+
+# Population tables in foreign-key order: parents always come first
+POPULATION_MODELS = (
+    NPC,
+    *(
+        model
+        for plan in DOMAIN_PLANS.values()
+        for model in (plan.record_model, *(child for child, _ in plan.children))
+    ),
+)
+
+
+def population_rows(
+    bundles: Iterable[PopulationBundle],
+    domains: tuple[str, ...] = DOMAINS,
+) -> dict[type, list[dict]]:
+    """
+    Split bundles into insert rows per table, in foreign-key order.
+
+    Child rows get their parent's id under the plan's foreign key, and the
+    nested child lists are dropped from the parent rows.
+    """
+    unknown = set(domains) - set(DOMAIN_PLANS)
+    if unknown:
+        raise ValueError(f"Unknown population domains: {', '.join(sorted(unknown))}")
+    plans = [(domain, DOMAIN_PLANS[domain]) for domain in domains]
+
+    rows: dict[type, list[dict]] = {model: [] for model in POPULATION_MODELS}
+    for bundle in bundles:
+        rows[NPC].append(bundle.npc)
+        for domain, plan in plans:
+            record = getattr(bundle, domain)
+            child_keys = [key for _, key in plan.children]
+            rows[plan.record_model].append(
+                {key: value for key, value in record.items() if key not in child_keys}
+            )
+            for child_model, key in plan.children:
+                rows[child_model].extend(
+                    {plan.foreign_key: record["id"], **child} for child in record[key]
+                )
+    return rows
@@ -1,6 +1,7 @@
 """Rogue employee scenario NPCs with pre-defined data."""
 
 from datetime import date, timedelta
+from uuid import uuid4
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -340,47 +341,43 @@ async def seed_scenario(db: AsyncSession, scenario: str) -> dict:
     npcs_created = 0
     health_records_created = 0
 
+    existing = await db.execute(
+        select(NPC.scenario_key).where(NPC.scenario_key.in_(SCENARIO_NPCS.keys()))
+    )
+    existing_keys = set(existing.scalars())
+
+    # Primary keys are assigned client-side so children can reference their
+    # parents without flushing each NPC and health record first.
     for npc_key, npc_data in SCENARIO_NPCS.items():
-        existing = await db.execute(select(NPC).where(NPC.scenario_key == npc_key))
-        if existing.scalar_one_or_none():
+        if npc_key in existing_keys:
             continue
 
         identity = npc_data["identity"]
-        npc = NPC(**identity)
-        db.add(npc)
-        await db.flush()
+        npc = NPC(id=uuid4(), **identity)
         npcs_created += 1
 
         health_data = npc_data["health"]
         health_record = HealthRecord(
+            id=uuid4(),
             npc_id=npc.id,
             insurance_provider=health_data["insurance_provider"],
             primary_care_physician=health_data["primary_care_physician"],
         )
-        db.add(health_record)
-        await db.flush()
         health_records_created += 1
 
-        for condition_data in health_data["conditions"]:
-            condition = HealthCondition(
-                health_record_id=health_record.id,
-                **condition_data,
-            )
-            db.add(condition)
-
-        for medication_data in health_data["medications"]:
-            medication = HealthMedication(
-                health_record_id=health_record.id,
-                **medication_data,
-            )
-            db.add(medication)
-
-        for visit_data in health_data["visits"]:
-            visit = HealthVisit(
-                health_record_id=health_record.id,
-                **visit_data,
-            )
-            db.add(visit)
+        db.add_all([npc, health_record])
+        db.add_all(
+            HealthCondition(health_record_id=health_record.id, **condition_data)
+            for condition_data in health_data["conditions"]
+        )
+        db.add_all(
+            HealthMedication(health_record_id=health_record.id, **medication_data)
+            for medication_data in health_data["medications"]
+        )
+        db.add_all(
+            HealthVisit(health_record_id=health_record.id, **visit_data)
+            for visit_data in health_data["visits"]
+        )
 
     await db.commit()
 
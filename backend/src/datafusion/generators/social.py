@@ -1,7 +1,7 @@
 """Social media data generator for NPCs."""
 
 import random
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from faker import Faker
 
@@ -44,6 +44,7 @@ def generate_social_media_record(npc_id: UUID, seed: int | None = None) -> dict:
     uses_encryption = random.random() < 0.20
 
     record = {
+        "id": uuid4(),
         "npc_id": npc_id,
         "has_public_profile": has_public_profile,
         "primary_platform": None,
@@ -1,7 +1,11 @@
 """Structured logging configuration for the application."""
 
 import logging
+import queue
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 from datafusion.config import settings
@@ -96,3 +100,32 @@ def get_logger(name: str) -> logging.Logger:
         Configured logger instance
     """
     return logging.getLogger(name)
+
+
+@contextmanager
+def queued_console_logging(logger: logging.Logger) -> Iterator[None]:
+    """Print a logger's messages to stdout from a background thread.
+
+    Used by the CLI scripts: records are only queued on the calling thread and
+    a QueueListener performs the blocking writes, so logging never stalls the
+    event loop. Output is the bare message, like print(), and every queued
+    record is flushed when the block exits.
+
+    Args:
+        logger: Logger to route through the queue; it stops propagating to root
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, console_handler)
+
+    queue_handler = QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        logger.removeHandler(queue_handler)
@@ -8,7 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from datafusion.api import router as api_router
 from datafusion.config import settings
-from datafusion.database import Base, engine
+from datafusion.database import Base, engine, warm_pool
 from datafusion.logging_config import setup_logging
 from datafusion.services.content_validator import validate_all_content
 
@@ -35,6 +35,9 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database tables created/verified")
 
+    await warm_pool()
+    logger.info("Database pool warmed")
+
     yield
 
     logger.info("Application shutting down")
@@ -52,8 +55,8 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=settings.cors_allow_methods,
+    allow_headers=settings.cors_allow_headers,
 )
 
 app.include_router(api_router, prefix=settings.api_prefix)
@@ -4,7 +4,7 @@ import enum
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -76,6 +76,8 @@ class AbuseAction(Base):
     """
 
     __tablename__ = "abuse_actions"
+    # Serves the per-role content rating check when filtering roles
+    __table_args__ = (Index("idx_abuse_action_role_rating", "role_id", "content_rating"),)
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     role_id: Mapped[UUID] = mapped_column(
@@ -144,6 +146,7 @@ class AbuseExecution(Base):
 
     # Relationships
     action: Mapped["AbuseAction"] = relationship(back_populates="executions")
+    target_npc: Mapped["NPC"] = relationship()  # type: ignore
 
     def __repr__(self) -> str:
         return f"<AbuseExecution {self.id}: action={self.action_id}, detected={self.was_detected}>"
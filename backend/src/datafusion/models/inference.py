@@ -13,6 +13,16 @@ class ContentRating(str, enum.Enum):
     DYSTOPIAN = "DYSTOPIAN"  # Extreme scenarios, demonstrating worst-case abuse
 
 
+# Severity order of content ratings, for "at most this rating" comparisons
+CONTENT_RATING_ORDER = {
+    ContentRating.SAFE: 1,
+    ContentRating.CAUTIONARY: 2,
+    ContentRating.SERIOUS: 3,
+    ContentRating.DISTURBING: 4,
+    ContentRating.DYSTOPIAN: 5,
+}
+
+
 class RuleCategory(str, enum.Enum):
     """Categories of cross-domain inference rules for organization."""
 
@@ -4,6 +4,7 @@ import enum
 from datetime import date, datetime
 
 from sqlalchemy import Boolean, Date, DateTime, Enum, Index, Integer, String
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from datafusion.database import Base, TimestampMixin, UUIDMixin
@@ -54,7 +55,30 @@ class NPC(Base, UUIDMixin, TimestampMixin):
     is_hospitalized: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     injury_from_action_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
 
+    @hybrid_property
+    def full_name(self) -> str:
+        """First and last name; also usable in queries as a SQL concatenation."""
+        return self.first_name + " " + self.last_name
+
     # Relationships
     message_record: Mapped["MessageRecord | None"] = relationship(  # type: ignore
         back_populates="npc", uselist=False
     )
+
+    # Read-only links to each domain record, for loading a full profile in one query.
+    # The records are still created and deleted through their own npc_id.
+    health_record: Mapped["HealthRecord | None"] = relationship(  # type: ignore
+        uselist=False, viewonly=True
+    )
+    finance_record: Mapped["FinanceRecord | None"] = relationship(  # type: ignore
+        uselist=False, viewonly=True
+    )
+    judicial_record: Mapped["JudicialRecord | None"] = relationship(  # type: ignore
+        uselist=False, viewonly=True
+    )
+    location_record: Mapped["LocationRecord | None"] = relationship(  # type: ignore
+        uselist=False, viewonly=True
+    )
+    social_media_record: Mapped["SocialMediaRecord | None"] = relationship(  # type: ignore
+        uselist=False, viewonly=True
+    )
@@ -0,0 +1,19 @@
+"""Event loop runner for command-line scripts."""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
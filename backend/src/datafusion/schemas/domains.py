@@ -2,6 +2,7 @@
 
 import enum
 from typing import Annotated, Union
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -42,3 +43,11 @@ class NPCWithDomains(BaseModel):
     domains: dict[DomainType, DomainData]
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class NPCBatchRequest(BaseModel):
+    """Request schema for batch NPC fetching."""
+
+    npc_ids: list[UUID]
+    # Validated against DomainType when the request is parsed
+    domains: set[DomainType] | None = None
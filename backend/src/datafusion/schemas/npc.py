@@ -70,10 +70,3 @@ class NPCListResponse(BaseModel):
     total: int
     limit: int
     offset: int
-
-
-class NPCBatchRequest(BaseModel):
-    """Request schema for batch NPC fetching."""
-
-    npc_ids: list[UUID]
-    domains: list[str] | None = None
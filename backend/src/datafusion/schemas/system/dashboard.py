@@ -6,13 +6,18 @@ Schemas for operator dashboard display, metrics, and alerts.
 
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .enums import AlertType, AlertUrgency, ComplianceTrend
 
 
 class DirectiveRead(BaseModel):
-    """Directive information for display."""
+    """Directive information for display.
+
+    Frozen because built instances are cached and shared between requests.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     id: UUID
     directive_key: str
@@ -20,7 +25,7 @@ class DirectiveRead(BaseModel):
     title: str
     description: str
     internal_memo: str | None = Field(description="Revealed after directive completion")
-    required_domains: list[str]
+    required_domains: tuple[str, ...]
     flag_quota: int
     time_limit_hours: int | None
     moral_weight: int
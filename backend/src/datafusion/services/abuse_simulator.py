@@ -150,7 +150,7 @@ class AbuseSimulator:
         # For now, simplified placeholder
         data_revealed = {
             "npc_id": str(npc.id),
-            "name": f"{npc.first_name} {npc.last_name}",
+            "name": npc.full_name,
             "ssn": npc.ssn,
             "address": f"{npc.street_address}, {npc.city}, {npc.state} {npc.zip_code}",
         }
@@ -169,7 +169,7 @@ class AbuseSimulator:
         return AbuseExecuteResponse(
             execution_id=execution.id,
             action_name=action.name,
-            target_name=f"{npc.first_name} {npc.last_name}",
+            target_name=npc.full_name,
             immediate_result=immediate_result,
             data_revealed=data_revealed,
             was_detected=was_detected,
@@ -268,7 +268,7 @@ class AbuseSimulator:
     def _generate_immediate_result(self, action: AbuseAction, npc: NPC) -> str:
         """Generate immediate result text for an action."""
         return (
-            f"You successfully accessed {npc.first_name} {npc.last_name}'s data. "
+            f"You successfully accessed {npc.full_name}'s data. "
             f"Using your {action.name.lower()}, you can now see their private information."
         )
 
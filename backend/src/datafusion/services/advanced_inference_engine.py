@@ -54,6 +54,30 @@ class InferenceContext:
         }
         return all(domain_map.get(domain, False) for domain in required_domains)
 
+    def restricted_to(self, domains: list[DomainType]) -> "InferenceContext":
+        """Return a view of this context with only the given domains' data."""
+        return InferenceContext(
+            self.npc,
+            health=self.health if DomainType.HEALTH in domains else None,
+            finance=self.finance if DomainType.FINANCE in domains else None,
+            judicial=self.judicial if DomainType.JUDICIAL in domains else None,
+            location=self.location if DomainType.LOCATION in domains else None,
+            social=self.social if DomainType.SOCIAL in domains else None,
+        )
+
+
+def _build_rule_plan(engine_class: type) -> list[tuple[dict[str, Any], list[str], str]]:
+    """
+    Pair every active rule with its required domain values and condition method name.
+
+    Rules whose condition method engine_class does not define are left out.
+    """
+    return [
+        (rule, [d.value for d in rule["required_domains"]], rule["condition_function"])
+        for rule in INFERENCE_RULES
+        if getattr(engine_class, rule["condition_function"], None) is not None
+    ]
+
 
 class AdvancedInferenceEngine:
     """
@@ -64,6 +88,14 @@ class AdvancedInferenceEngine:
     - A dict of variables for template rendering if the condition is met
     """
 
+    # (rule, required domain values, condition method name) for every active rule
+    # whose condition method exists, resolved once per class
+    rule_plan: list[tuple[dict[str, Any], list[str], str]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.rule_plan = _build_rule_plan(cls)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -83,23 +115,46 @@ class AdvancedInferenceEngine:
         # Load domain data based on what's enabled
         context = await self._build_context(npc, enabled_domains)
 
-        # Load all active inference rules from config
-        rules = self._load_active_rules()
+        return self._evaluate_rules(context)
+
+    async def generate_unlocked_inferences(
+        self,
+        npc_id: UUID,
+        current_domains: list[DomainType],
+        new_domain: DomainType,
+    ) -> list[dict[str, Any]]:
+        """
+        Generate the inferences that enabling new_domain would add to current_domains.
+
+        Domain data is loaded once, for current_domains plus new_domain, and the
+        rules are evaluated against both views of it, so this costs the queries
+        of a single generate_inferences call.
+        """
+        npc = await self._load_npc(npc_id)
+        if not npc:
+            return []
 
-        # Evaluate each rule
+        context = await self._build_context(npc, [*current_domains, new_domain])
+        current_rule_keys = {
+            result["rule_key"]
+            for result in self._evaluate_rules(context.restricted_to(current_domains))
+        }
+        return [
+            result
+            for result in self._evaluate_rules(context)
+            if result["rule_key"] not in current_rule_keys
+        ]
+
+    def _evaluate_rules(self, context: InferenceContext) -> list[dict[str, Any]]:
+        """Evaluate every active rule against context, scariest results first."""
         results = []
-        for rule in rules:
+        for rule, required_domain_values, condition_name in self.rule_plan:
             # Check if we have required domains
-            required_domain_values = [d.value for d in rule["required_domains"]]
             if not context.has_domains(required_domain_values):
                 continue
 
-            # Evaluate condition
-            condition_func = getattr(self, rule["condition_function"], None)
-            if not condition_func:
-                continue
-
-            variables = condition_func(context)
+            # Looked up on self so a subclass's override is the one that runs
+            variables = getattr(self, condition_name)(context)
             if variables is None:
                 continue
 
@@ -153,10 +208,6 @@ class AdvancedInferenceEngine:
 
         return InferenceContext(npc, health, finance, judicial, location, social)
 
-    def _load_active_rules(self) -> list[dict[str, Any]]:
-        """Load all active inference rules from config."""
-        return INFERENCE_RULES
-
     def _render_inference(self, rule: dict[str, Any], variables: dict[str, Any]) -> dict[str, Any]:
         """Render inference templates with provided variables."""
         return {
@@ -709,3 +760,6 @@ async def generate_advanced_inferences(
     """
     engine = AdvancedInferenceEngine(db)
     return await engine.generate_inferences(npc_id, enabled_domains)
+
+
+AdvancedInferenceEngine.rule_plan = _build_rule_plan(AdvancedInferenceEngine)
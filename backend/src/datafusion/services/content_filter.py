@@ -1,6 +1,6 @@
 """Content filtering service for managing sensitive content display."""
 
-from datafusion.models.inference import ContentRating
+from datafusion.models.inference import CONTENT_RATING_ORDER, ContentRating
 from datafusion.schemas.abuse import AbuseActionRead, ConsequenceChain
 
 
@@ -15,13 +15,7 @@ class ContentFilter:
             max_rating: Maximum content rating the user wants to see
         """
         self.max_rating = max_rating
-        self.rating_hierarchy = {
-            ContentRating.SAFE: 1,
-            ContentRating.CAUTIONARY: 2,
-            ContentRating.SERIOUS: 3,
-            ContentRating.DISTURBING: 4,
-            ContentRating.DYSTOPIAN: 5,
-        }
+        self.rating_hierarchy = CONTENT_RATING_ORDER
         self.max_level = self.rating_hierarchy[max_rating]
 
     def filter_actions(self, actions: list[AbuseActionRead]) -> list[AbuseActionRead]:
@@ -36,6 +36,21 @@ from datafusion.services.content_loader import (
     load_risk_config,
 )
 
+# Load configuration from JSON files once at module import
+_RISK_CONFIG = load_risk_config()
+_KEYWORDS = load_keywords()
+_CORRELATION_CONFIG = load_correlation_alerts()
+
+# Risk factors from the config, with their domain parsed to DomainType
+RISK_FACTORS = {
+    factor_key: {
+        "weight": factor_data["weight"],
+        "domain": DomainType(factor_data["domain"]),
+        "description": factor_data["description"],
+    }
+    for factor_key, factor_data in _RISK_CONFIG["risk_factors"].items()
+}
+
 
 class RiskScorer:
     """
@@ -49,31 +64,14 @@ class RiskScorer:
     CACHE_TTL_HOURS = 1
 
     def __init__(self, db: AsyncSession):
-        """Initialize with database session and load configuration."""
+        """Initialize with database session and the shared configuration."""
         self.db = db
 
-        # Load configuration from JSON files
-        self._risk_config = load_risk_config()
-        self._keywords = load_keywords()
-        self._correlation_config = load_correlation_alerts()
-
-        # Parse risk factors into usable format with domain enum
-        self.RISK_FACTORS = {}
-        for factor_key, factor_data in self._risk_config["risk_factors"].items():
-            domain_str = factor_data["domain"]
-            # Map domain string to DomainType enum
-            domain_map = {
-                "health": DomainType.HEALTH,
-                "finance": DomainType.FINANCE,
-                "judicial": DomainType.JUDICIAL,
-                "location": DomainType.LOCATION,
-                "social": DomainType.SOCIAL,
-            }
-            self.RISK_FACTORS[factor_key] = {
-                "weight": factor_data["weight"],
-                "domain": domain_map[domain_str],
-                "description": factor_data["description"],
-            }
+        # Configuration is shared across instances, loaded once at import
+        self._risk_config = _RISK_CONFIG
+        self._keywords = _KEYWORDS
+        self._correlation_config = _CORRELATION_CONFIG
+        self.RISK_FACTORS = RISK_FACTORS
 
         # Store config data for easy access
         self.risk_boundaries = self._risk_config["risk_level_boundaries"]
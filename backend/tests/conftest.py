@@ -1,11 +1,15 @@
 """Pytest configuration and fixtures."""
 
+from contextlib import contextmanager
 from datetime import date
 from decimal import Decimal
+from itertools import count
 from uuid import uuid4
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from datafusion.database import Base, get_db
@@ -79,6 +83,80 @@ async def client(db_session):
         app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="function")
+def count_selects(db_session):
+    """Provide a context manager that collects the SELECT statements run inside it."""
+    engine = db_session.bind.sync_engine
+
+    @contextmanager
+    def counting():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return counting
+
+
+@pytest.fixture(scope="function")
+def keep_loaded(db_session):
+    """Provide a function that starts holding every instance db_session loads from then on.
+
+    The strong references let tests inspect objects after the request that loaded them.
+    """
+    sync_session = db_session.sync_session
+    listeners = []
+
+    def start():
+        loaded = []
+
+        def loaded_as_persistent(session, instance):
+            loaded.append(instance)
+
+        event.listen(sync_session, "loaded_as_persistent", loaded_as_persistent)
+        listeners.append(loaded_as_persistent)
+        return loaded
+
+    yield start
+    for listener in listeners:
+        event.remove(sync_session, "loaded_as_persistent", listener)
+
+
+@pytest.fixture(scope="function")
+def make_npc(db_session):
+    """Provide a factory that adds numbered citizens (Citizen0, Citizen1, ...) to the session."""
+    numbers = count()
+
+    def factory(**fields):
+        number = next(numbers)
+        npc = NPC(
+            id=uuid4(),
+            first_name=f"Citizen{number}",
+            last_name="Test",
+            date_of_birth=date(1990, 1, 1),
+            ssn=f"111-22-{number:04d}",
+            street_address="123 Test St",
+            city="Test",
+            state="TS",
+            zip_code="12345",
+            sprite_key="citizen_1",
+            map_x=10,
+            map_y=10,
+            **fields,
+        )
+        db_session.add(npc)
+        return npc
+
+    return factory
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_directive(db_session):
     """Provide a test directive."""
@@ -0,0 +1,252 @@
+"""Tests for abuse simulation API endpoints."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from datafusion.api import abuse as abuse_api
+from datafusion.config import settings
+from datafusion.models.abuse import AbuseAction, AbuseExecution, AbuseRole
+
+
+@pytest.fixture
+async def abuse_action(db_session):
+    """Create a role with a single action."""
+    role = AbuseRole(
+        role_key="test_role",
+        display_name="Test Role",
+        description="Role for API tests",
+        authorized_domains='["health"]',
+    )
+    db_session.add(role)
+    await db_session.flush()
+
+    action = AbuseAction(
+        role_id=role.id,
+        action_key="test_snoop",
+        name="Snoop Records",
+        description="Look at records you should not",
+        target_type="any_npc",
+        content_rating="CAUTIONARY",
+        detection_chance=0.1,
+        consequence_severity="low",
+    )
+    db_session.add(action)
+    await db_session.flush()
+    return action
+
+
+async def add_executions(db_session, action, npc, count):
+    """Record count executions of action against npc in a new session."""
+    session_id = uuid4()
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    db_session.add_all(
+        [
+            AbuseExecution(
+                session_id=session_id,
+                role_id=action.role_id,
+                action_id=action.id,
+                target_npc_id=npc.id,
+                executed_at=start + timedelta(minutes=i),
+                was_detected=i % 2 == 1,
+            )
+            for i in range(count)
+        ]
+    )
+    await db_session.flush()
+    return session_id
+
+
+class TestListRoles:
+    """Test GET /api/abuse/roles endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_list_roles(self, client, abuse_action):
+        """Roles are listed without their actions."""
+        response = await client.get("/api/abuse/roles")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [role["role_key"] for role in data] == ["test_role"]
+        assert "actions" not in data[0]
+
+    @pytest.mark.asyncio
+    async def test_list_roles_filtered_by_content_rating(self, client, abuse_action):
+        """Roles with an action above max_content_rating are excluded."""
+        allowed = await client.get("/api/abuse/roles", params={"max_content_rating": "SERIOUS"})
+        excluded = await client.get("/api/abuse/roles", params={"max_content_rating": "SAFE"})
+
+        assert [role["role_key"] for role in allowed.json()] == ["test_role"]
+        assert excluded.json() == []
+
+    @pytest.mark.asyncio
+    async def test_list_roles_does_not_load_actions(
+        self, client, db_session, abuse_action, keep_loaded
+    ):
+        """Role actions are not loaded; touching them raises instead of querying."""
+        db_session.expunge_all()
+        loaded = keep_loaded()
+
+        response = await client.get("/api/abuse/roles")
+        assert response.status_code == 200
+
+        (role,) = [obj for obj in loaded if isinstance(obj, AbuseRole)]
+        with pytest.raises(InvalidRequestError):
+            role.actions
+
+    @pytest.mark.asyncio
+    async def test_list_roles_not_modified(self, client, db_session, abuse_action):
+        """A matching If-None-Match gets a 304 until the roles change."""
+        first = await client.get("/api/abuse/roles")
+        etag = first.headers["etag"]
+
+        cached = await client.get("/api/abuse/roles", headers={"If-None-Match": etag})
+        filtered = await client.get(
+            "/api/abuse/roles",
+            params={"max_content_rating": "SAFE"},
+            headers={"If-None-Match": etag},
+        )
+        db_session.add(
+            AbuseRole(
+                role_key="other_role",
+                display_name="Other Role",
+                description="Added after the first listing",
+                authorized_domains="[]",
+            )
+        )
+        await db_session.flush()
+        changed = await client.get("/api/abuse/roles", headers={"If-None-Match": etag})
+
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+        assert filtered.status_code == 200
+        assert changed.status_code == 200
+        assert len(changed.json()) == 2
+
+
+class TestSessionHistory:
+    """Test GET /api/abuse/session/{session_id}/history endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_history_empty_session(self, client):
+        """An unknown session has no history."""
+        response = await client.get(f"/api/abuse/session/{uuid4()}/history")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_history_in_execution_order(self, client, db_session, abuse_action, test_npc):
+        """History lists each execution with its action and target names."""
+        session_id = await add_executions(db_session, abuse_action, test_npc, 2)
+
+        response = await client.get(f"/api/abuse/session/{session_id}/history")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 2
+        assert [item["was_detected"] for item in data] == [False, True]
+        assert data[0]["action_name"] == "Snoop Records"
+        assert data[0]["target_name"] == "Test Citizen"
+        assert data[0]["immediate_result"] == "Executed Snoop Records on Test Citizen"
+
+    @pytest.mark.asyncio
+    async def test_history_pagination(self, client, db_session, abuse_action, test_npc):
+        """limit and offset page through the history in order."""
+        session_id = await add_executions(db_session, abuse_action, test_npc, 5)
+        full = (await client.get(f"/api/abuse/session/{session_id}/history")).json()
+
+        response = await client.get(
+            f"/api/abuse/session/{session_id}/history", params={"limit": 2, "offset": 1}
+        )
+
+        assert response.status_code == 200
+        assert len(full) == 5
+        assert response.json() == full[1:3]
+
+    @pytest.mark.asyncio
+    async def test_history_without_limit_is_complete(
+        self, client, db_session, abuse_action, test_npc
+    ):
+        """Without a limit, history is not cut off at the default page size."""
+        session_id = await add_executions(
+            db_session, abuse_action, test_npc, settings.default_page_size + 1
+        )
+
+        response = await client.get(f"/api/abuse/session/{session_id}/history")
+
+        assert response.status_code == 200
+        assert len(response.json()) == settings.default_page_size + 1
+
+    @pytest.mark.asyncio
+    async def test_history_streams_in_batches(
+        self, client, db_session, abuse_action, test_npc, monkeypatch
+    ):
+        """Histories longer than one streamed batch are returned in full."""
+        session_id = await add_executions(db_session, abuse_action, test_npc, 5)
+        db_session.expunge_all()
+        monkeypatch.setattr(abuse_api, "HISTORY_YIELD_PER", 2)
+
+        response = await client.get(f"/api/abuse/session/{session_id}/history")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 5
+        assert {item["target_name"] for item in data} == {"Test Citizen"}
+
+    @pytest.mark.asyncio
+    async def test_history_query_count_independent_of_size(
+        self, client, db_session, abuse_action, test_npc, count_selects
+    ):
+        """Related rows are batch-loaded instead of queried per execution."""
+        small_session = await add_executions(db_session, abuse_action, test_npc, 1)
+        large_session = await add_executions(db_session, abuse_action, test_npc, 5)
+        db_session.expunge_all()
+
+        counts = []
+        for session_id in (small_session, large_session):
+            with count_selects() as statements:
+                response = await client.get(f"/api/abuse/session/{session_id}/history")
+            assert response.status_code == 200
+            counts.append(len(statements))
+
+        assert counts[0] == counts[1]
+
+    @pytest.mark.asyncio
+    async def test_history_raises_on_unloaded_relationship(
+        self, client, db_session, abuse_action, test_npc, keep_loaded
+    ):
+        """Relationships the endpoint did not ask for raise instead of lazy loading."""
+        session_id = await add_executions(db_session, abuse_action, test_npc, 1)
+        db_session.expunge_all()
+        loaded = keep_loaded()
+
+        response = await client.get(f"/api/abuse/session/{session_id}/history")
+        assert response.status_code == 200
+
+        (execution,) = [obj for obj in loaded if isinstance(obj, AbuseExecution)]
+        assert execution.action.name == "Snoop Records"
+        with pytest.raises(InvalidRequestError):
+            execution.action.role
+
+
+class TestResetSession:
+    """Test POST /api/abuse/session/{session_id}/reset endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_only_that_session(self, client, db_session, abuse_action, test_npc):
+        """Resetting a session deletes its executions and leaves other sessions alone."""
+        reset_id = await add_executions(db_session, abuse_action, test_npc, 3)
+        kept_id = await add_executions(db_session, abuse_action, test_npc, 2)
+        db_session.expunge_all()
+
+        response = await client.post(f"/api/abuse/session/{reset_id}/reset")
+        assert response.status_code == 204
+
+        reset = await client.get(f"/api/abuse/session/{reset_id}/history")
+        kept = await client.get(f"/api/abuse/session/{kept_id}/history")
+        assert reset.json() == []
+        assert len(kept.json()) == 2
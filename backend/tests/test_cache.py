@@ -0,0 +1,81 @@
+"""Tests for the in-process caches."""
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine
+
+from datafusion import cache
+from datafusion.cache import LRUCache, TTLCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Going over maxsize drops the entry read or written longest ago."""
+    lru = LRUCache(maxsize=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+
+    assert len(lru) == 2
+    assert lru.get("a") == 1
+    assert lru.get("b", "missing") == "missing"
+    assert lru.get("c") == 3
+
+
+def test_get_returns_stored_value():
+    """Stored values come back until they expire."""
+    ttl_cache = TTLCache(maxsize=2, ttl=60)
+    ttl_cache.set("a", b"page")
+
+    assert ttl_cache.get("a") == b"page"
+    assert ttl_cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    """An entry is dropped once its ttl has passed."""
+    now = 1000.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+    ttl_cache = TTLCache(maxsize=2, ttl=5)
+    ttl_cache.set("a", b"page")
+
+    now += 4.9
+    assert ttl_cache.get("a") == b"page"
+    now += 0.2
+    assert ttl_cache.get("a") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Going over maxsize evicts the entry read or written longest ago."""
+    ttl_cache = TTLCache(maxsize=2, ttl=60)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("c") == 3
+
+
+def test_zero_ttl_disables_caching():
+    """With a ttl of zero nothing is stored."""
+    ttl_cache = TTLCache(maxsize=2, ttl=0)
+    ttl_cache.set("a", 1)
+
+    assert ttl_cache.get("a") is None
+
+
+def test_cleared_when_table_recreated():
+    """Creating or dropping the watched table empties the cache."""
+    metadata = MetaData()
+    table = Table("cached_rows", metadata, Column("id", Integer, primary_key=True))
+    ttl_cache = TTLCache(maxsize=2, ttl=60)
+    cache.clear_when_recreated(ttl_cache, table)
+    engine = create_engine("sqlite://")
+
+    ttl_cache.set("a", 1)
+    metadata.create_all(engine)
+    created = ttl_cache.get("a")
+    ttl_cache.set("a", 1)
+    metadata.drop_all(engine)
+
+    assert created is None
+    assert ttl_cache.get("a") is None
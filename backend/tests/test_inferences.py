@@ -14,6 +14,10 @@ from datafusion.models.health import (
     Severity,
 )
 from datafusion.models.npc import NPC, Role
+from datafusion.services.advanced_inference_engine import (
+    AdvancedInferenceEngine,
+    InferenceContext,
+)
 
 
 @pytest.fixture
@@ -369,3 +373,39 @@ async def test_unlockable_inferences_structure(client, test_npc_with_health):
         assert "rule_keys" in item
         assert isinstance(item["rule_keys"], list)
         assert len(item["rule_keys"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_list_inference_rules_not_modified(client):
+    """Clients that send back the rules ETag get an empty 304."""
+    first = await client.get("/api/inferences/rules")
+    etag = first.headers["etag"]
+
+    cached = await client.get("/api/inferences/rules", headers={"If-None-Match": etag})
+    stale = await client.get("/api/inferences/rules", headers={"If-None-Match": '"stale"'})
+
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert stale.status_code == 200
+    assert stale.json() == first.json()
+
+
+def test_subclass_condition_overrides_are_used():
+    """Rules run the condition method found on the engine, so subclass overrides apply."""
+    called = []
+    overrides = {
+        name: lambda self, context, name=name: called.append(name)
+        for _, _, name in AdvancedInferenceEngine.rule_plan
+    }
+    engine_class = type("QuietEngine", (AdvancedInferenceEngine,), overrides)
+    context = InferenceContext(
+        npc=None,
+        health=object(),
+        finance=object(),
+        judicial=object(),
+        location=object(),
+        social=object(),
+    )
+
+    assert engine_class(db=None)._evaluate_rules(context) == []
+    assert sorted(called) == sorted(overrides)
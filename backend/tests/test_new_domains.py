@@ -7,14 +7,17 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from datafusion.generators import generate_population_bundles
 from datafusion.generators.finance import generate_finance_record
 from datafusion.generators.judicial import generate_judicial_record
 from datafusion.generators.location import generate_location_record
+from datafusion.generators.rows import population_rows
 from datafusion.generators.social import generate_social_media_record
 from datafusion.models.finance import (
     BankAccount,
     FinanceRecord,
 )
+from datafusion.models.health import HealthRecord
 from datafusion.models.judicial import (
     JudicialRecord,
     TrafficViolation,
@@ -305,8 +308,39 @@ async def test_generate_all_domains_integration():
     assert location_data["npc_id"] == npc_id
     assert social_data["npc_id"] == npc_id
 
+    # Record ids are assigned up front so children can reference them before insert
+    record_ids = {
+        finance_data["id"],
+        judicial_data["id"],
+        location_data["id"],
+        social_data["id"],
+    }
+    assert len(record_ids) == 4
+
     # All should have generated some data
     assert len(finance_data["bank_accounts"]) > 0 or len(finance_data["transactions"]) > 0
     # Judicial may have no records (clean record)
     assert location_data["tracking_enabled"] is not None
     assert social_data["has_public_profile"] is not None
+
+
+def test_population_rows_join_children_to_parents():
+    """Test population rows are split per table and joined by pre-assigned ids."""
+    bundles = generate_population_bundles(3, seed=42)
+    rows = population_rows(bundles, domains=("finance",))
+
+    assert [row["id"] for row in rows[NPC]] == [b.npc["id"] for b in bundles]
+    assert len(rows[FinanceRecord]) == 3
+    assert rows[HealthRecord] == []
+
+    # Nested child lists are stripped from parent rows and flattened per table
+    finance_ids = {row["id"] for row in rows[FinanceRecord]}
+    assert all("bank_accounts" not in row for row in rows[FinanceRecord])
+    assert all(row["finance_record_id"] in finance_ids for row in rows[BankAccount])
+    assert len(rows[BankAccount]) == sum(len(b.finance["bank_accounts"]) for b in bundles)
+
+
+def test_population_rows_rejects_unknown_domain():
+    """Test unknown domains are rejected."""
+    with pytest.raises(ValueError, match="Unknown population domains"):
+        population_rows([], domains=("dreams",))
@@ -8,7 +8,9 @@ from decimal import Decimal
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 
+from datafusion.api import npcs as npcs_api
 from datafusion.models.finance import EmploymentStatus, FinanceRecord
 from datafusion.models.health import HealthCondition, HealthRecord, Severity
 from datafusion.models.location import InferredLocation, LocationRecord, LocationType
@@ -194,6 +196,46 @@ class TestListNPCs:
         assert data["offset"] == 2
         assert data["total"] == 5
 
+    @pytest.mark.asyncio
+    async def test_list_npcs_offset_past_end(self, client, test_npc):
+        """A page past the end is empty but still reports the total."""
+        response = await client.get("/api/npcs/?limit=2&offset=10")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_list_npcs_streams_in_batches(self, client, db_session, make_npc, monkeypatch):
+        """Pages longer than one streamed batch are returned in full."""
+        for _ in range(5):
+            make_npc()
+        await db_session.flush()
+        monkeypatch.setattr(npcs_api, "NPC_LIST_YIELD_PER", 2)
+
+        response = await client.get("/api/npcs/")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        assert sorted(item["first_name"] for item in data["items"]) == [
+            f"Citizen{i}" for i in range(5)
+        ]
+        assert data["items"][0]["role"] == "citizen"
+
+    @pytest.mark.asyncio
+    async def test_list_npcs_served_from_cache(self, client, db_session, test_npc, count_selects):
+        """A repeat page load is served from the cache without querying."""
+        first = await client.get("/api/npcs/")
+        test_npc.map_x = 101
+        await db_session.flush()
+        with count_selects() as statements:
+            cached = await client.get("/api/npcs/")
+
+        assert cached.json() == first.json()
+        assert statements == []
+
 
 class TestGetNPC:
     """Test GET /api/npcs/{npc_id} endpoint."""
@@ -315,6 +357,21 @@ class TestGetNPCDomainData:
         assert data["insurance_provider"] == "TestHealth Insurance"
         assert len(data["conditions"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_domain_data_raises_on_unloaded_relationship(
+        self, client, db_session, npc_with_health, keep_loaded
+    ):
+        """Only the response's child lists are loaded; other relationships raise."""
+        db_session.expunge_all()
+        loaded = keep_loaded()
+
+        response = await client.get(f"/api/npcs/{npc_with_health.id}/domain/health")
+        assert response.status_code == 200
+
+        (condition,) = [obj for obj in loaded if isinstance(obj, HealthCondition)]
+        with pytest.raises(InvalidRequestError):
+            condition.health_record
+
     @pytest.mark.asyncio
     async def test_get_finance_domain_data(self, client, npc_with_finance):
         """Getting specific finance domain should return finance data."""
@@ -353,6 +410,33 @@ class TestGetNPCDomainData:
         assert "Health record not found" in response.json()["detail"]
 
 
+class TestGetNPCFull:
+    """Test GET /api/npcs/{npc_id}/full endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_full_profile_matches_all_domains(
+        self, client, npc_with_health, npc_with_location
+    ):
+        """The full profile has every domain the NPC has data for."""
+        all_domains = "domains=health&domains=finance&domains=judicial&domains=location"
+        expected = await client.get(f"/api/npcs/{npc_with_health.id}?{all_domains}&domains=social")
+
+        response = await client.get(f"/api/npcs/{npc_with_health.id}/full")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data["domains"]) == {"health", "location"}
+        assert data["domains"]["health"]["conditions"][0]["condition_name"] == "Test Condition"
+        assert data == expected.json()
+
+    @pytest.mark.asyncio
+    async def test_full_profile_not_found(self, client):
+        """An unknown NPC is a 404."""
+        response = await client.get(f"/api/npcs/{uuid4()}/full")
+
+        assert response.status_code == 404
+
+
 class TestNPCResponseSchema:
     """Test that NPC responses have correct schema structure."""
 
@@ -582,6 +666,65 @@ class TestBatchGetNPCs:
         assert data[0]["domains"]["health"]["insurance_provider"] == "BatchHealth"
         assert data[0]["domains"]["finance"]["employer_name"] == "BatchCorp"
 
+    @pytest.mark.asyncio
+    async def test_batch_get_npcs_domains_matched_per_npc(self, client, db_session, make_npc):
+        """Domain records loaded for the whole batch go to their own NPC."""
+        npcs = [make_npc() for _ in range(3)]
+        await db_session.flush()
+
+        # The last NPC has no health record
+        for i, npc in enumerate(npcs[:2]):
+            db_session.add(
+                HealthRecord(
+                    npc_id=npc.id,
+                    insurance_provider=f"Insurer{i}",
+                    primary_care_physician="Dr. Batch",
+                )
+            )
+        await db_session.flush()
+
+        response = await client.post(
+            "/api/npcs/batch",
+            json={"npc_ids": [str(npc.id) for npc in npcs], "domains": ["health"]},
+        )
+
+        assert response.status_code == 200
+        providers = {
+            item["npc"]["first_name"]: item["domains"].get("health", {}).get("insurance_provider")
+            for item in response.json()
+        }
+        assert providers == {"Citizen0": "Insurer0", "Citizen1": "Insurer1", "Citizen2": None}
+
+    @pytest.mark.asyncio
+    async def test_batch_query_count_independent_of_size(
+        self, client, db_session, make_npc, count_selects
+    ):
+        """Each requested domain costs the same queries however many NPCs are in the batch."""
+        npc_ids = []
+        for _ in range(4):
+            npc = make_npc()
+            db_session.add(
+                HealthRecord(
+                    npc_id=npc.id,
+                    insurance_provider="BatchHealth",
+                    primary_care_physician="Dr. Batch",
+                )
+            )
+            npc_ids.append(str(npc.id))
+        await db_session.flush()
+        db_session.expunge_all()
+
+        counts = []
+        for batch in (npc_ids[:1], npc_ids):
+            with count_selects() as statements:
+                response = await client.post(
+                    "/api/npcs/batch", json={"npc_ids": batch, "domains": ["health", "finance"]}
+                )
+            assert response.status_code == 200
+            counts.append(len(statements))
+
+        assert counts[0] == counts[1]
+
     @pytest.mark.asyncio
     async def test_batch_get_npcs_partial_results(self, client, test_npc):
         """Batch request with some invalid IDs should return only valid NPCs."""
@@ -607,3 +750,12 @@ class TestBatchGetNPCs:
         assert "npc" in data[0]
         assert "domains" in data[0]
         assert len(data[0]["domains"]) == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_get_npcs_invalid_domain(self, client, test_npc):
+        """Unknown domain names are rejected when the request is parsed."""
+        response = await client.post(
+            "/api/npcs/batch", json={"npc_ids": [str(test_npc.id)], "domains": ["dreams"]}
+        )
+
+        assert response.status_code == 422
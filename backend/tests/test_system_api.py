@@ -1,14 +1,18 @@
 """Tests for System Mode API endpoints."""
 
+from collections import deque
 from datetime import date
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
+from datafusion.api import system as system_api
 from datafusion.models.location import LocationRecord
 from datafusion.models.npc import NPC
 from datafusion.models.system_mode import (
     Directive,
+    Operator,
 )
 
 
@@ -101,6 +105,75 @@ class TestStartSystemMode:
         assert data["first_directive"]["week_number"] == 1
         assert data["first_directive"]["title"] == "Test Directive"
 
+    @pytest.mark.asyncio
+    async def test_start_assigns_distinct_operator_codes(self, client, setup_directive):
+        """Each session started by this process gets its own operator code."""
+        codes = []
+        for _ in range(20):
+            response = await client.post(
+                "/api/system/start",
+                json={"session_id": str(uuid4())},
+            )
+            assert response.status_code == 200
+            codes.append(response.json()["operator_code"])
+
+        assert len(set(codes)) == len(codes)
+
+    @pytest.mark.asyncio
+    async def test_start_caches_first_directive(
+        self, client, db_session, setup_directive, count_selects
+    ):
+        """A later start reuses the cached first directive instead of querying for it."""
+        await client.post("/api/system/start", json={"session_id": str(uuid4())})
+        setup_directive.title = "Revised Directive"
+        await db_session.flush()
+        with count_selects() as statements:
+            cached = await client.post("/api/system/start", json={"session_id": str(uuid4())})
+
+        assert cached.json()["first_directive"]["title"] == "Test Directive"
+        assert not any("FROM directives" in statement for statement in statements)
+
+    @pytest.mark.asyncio
+    async def test_start_skips_operator_codes_already_taken(
+        self, client, db_session, setup_directive, monkeypatch
+    ):
+        """A code already stored, e.g. from before a restart, is skipped."""
+        db_session.add(Operator(session_id=uuid4(), operator_code="OP-1111", compliance_score=85.0))
+        await db_session.flush()
+        monkeypatch.setattr(system_api, "_operator_codes", deque(["OP-1111", "OP-2222"]))
+
+        response = await client.post("/api/system/start", json={"session_id": str(uuid4())})
+
+        assert response.status_code == 200
+        assert response.json()["operator_code"] == "OP-2222"
+
+    @pytest.mark.asyncio
+    async def test_start_gives_up_when_codes_keep_conflicting(
+        self, client, db_session, setup_directive, monkeypatch
+    ):
+        """Start fails cleanly once every attempted code is taken."""
+        db_session.add(Operator(session_id=uuid4(), operator_code="OP-1111", compliance_score=85.0))
+        await db_session.flush()
+        monkeypatch.setattr(system_api, "_operator_codes", deque(["OP-1111"] * 3))
+
+        response = await client.post("/api/system/start", json={"session_id": str(uuid4())})
+
+        assert response.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_start_raises_on_conflicts_other_than_operator_code(
+        self, client, db_session, setup_directive, monkeypatch
+    ):
+        """Only an operator_code clash is retried; an id clash is a real error."""
+        existing = Operator(session_id=uuid4(), operator_code="OP-1111", compliance_score=85.0)
+        db_session.add(existing)
+        await db_session.flush()
+        monkeypatch.setattr(system_api, "uuid4", lambda: existing.id)
+        monkeypatch.setattr(system_api, "_operator_codes", deque(["OP-2222"]))
+
+        with pytest.raises(IntegrityError):
+            await client.post("/api/system/start", json={"session_id": str(uuid4())})
+
 
 class TestDashboard:
     """Test /system/dashboard endpoint."""